@@ -1,47 +1,43 @@
 #!/usr/bin/env python3
-import json
 import sys
 from binascii import unhexlify
-from optparse import OptionParser
+from argparse import ArgumentParser
 
 from somfy.recognizer import MessageRecognizer
+from somfy.output import format_message
+
+READ_CHUNK_SIZE = 65536
+# Deletion table for bytes.translate, strips everything that is not a hex digit
+NON_HEX_CHARS = bytes(c for c in range(256) if c not in b'0123456789ABCDEFabcdef')
 
 
 def do_read(input_stream, as_json, as_dict):
     mr = MessageRecognizer()
-    b1 = None
-    while True:
-        hexdata = input_stream.read(1)
-        if not hexdata:
-            break
-        for hexpart in hexdata:
-            if chr(hexpart) not in ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-                                    'A', 'B', 'C', 'D', 'E', 'F', 'a', 'b', 'c', 'd', 'e', 'f']:
-                continue
-            if b1 is not None:
-                byte = unhexlify(chr(b1) + chr(hexpart))
-                b1 = None
-                msg = mr.add_data(byte[0])
-                if msg:
-                    if as_dict:
-                        print(msg.as_dict())
-                    elif as_json:
-                        print(json.dumps(msg.as_dict(), sort_keys=True, default=lambda o: o.to_json()))
-                    else:
-                        print(msg.__str__())
-            else:
-                b1 = hexpart
+    # The trailing nibble of an odd-length chunk, carried over to the next one
+    leftover = b''
+    while chunk := input_stream.read(READ_CHUNK_SIZE):
+        hexchars = leftover + chunk.translate(None, delete=NON_HEX_CHARS)
+        if len(hexchars) % 2:
+            leftover = hexchars[-1:]
+            hexchars = hexchars[:-1]
+        else:
+            leftover = b''
+        # Write out all the messages from the chunk at once
+        lines = [format_message(msg, as_json, as_dict) for msg, _ in mr.add_bytes(unhexlify(hexchars))]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == '__main__':
-    parser = OptionParser("decode.py [options]")
-    parser.add_option("-f", "--file", dest="filename",
-                      help="read data from FILENAME instead of stdin")
-    parser.add_option("-j", "--json", action="store_true", dest="json",
-                      help="use JSON output")
-    parser.add_option("-d", "--dict", action="store_true", dest="as_dict",
-                      help="use augmented dict output")
-    (options, args) = parser.parse_args()
+    parser = ArgumentParser(description="Decode the binhex-formatted SDN traffic")
+    parser.add_argument("-f", "--file", dest="filename",
+                        help="read data from FILENAME instead of stdin")
+    parser.add_argument("-j", "--json", action="store_true", dest="json",
+                        help="use JSON output")
+    parser.add_argument("-d", "--dict", action="store_true", dest="as_dict",
+                        help="use augmented dict output")
+    options = parser.parse_args()
 
     if options.filename:
         with open(options.filename, 'rb') as f:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import asyncio
 import typing
-from optparse import OptionParser
+from argparse import ArgumentParser
 
 from somfy.connector import SomfyConnector, SocketConnectionFactory, fire_and_forget, detect_devices, \
     try_to_exchange_one
@@ -11,7 +11,6 @@ from somfy.payloads import MotorRotationDirectionPayload, PostMotorLimitsPayload
     CtrlMoveToPayload, CtrlMoveToFunction, CtrlStopPayload, CtrlMoveRelativePayload, RelativeMoveFunction, \
     PostMotorStatusPayload, SomfyNackReason, MotorRotationDirection, CtrlMoveForcedPayload, SomfyDirection, \
     SetMotorLimitsPayload, SetLimitsFunction
-from somfy.serial import SerialConnectionFactory
 from somfy.utils import wait_for_completion, SomfyNackException, send_with_ack
 
 
@@ -70,7 +69,7 @@ async def do_move(connector: SomfyConnector, opts):
         raise Exception("No --percent specified")
 
     addr = SomfyAddress.make(opts.addr)
-    payload = CtrlMoveToPayload.make(func=CtrlMoveToFunction.POSITION_PERCENT, position=int(opts.percent))
+    payload = CtrlMoveToPayload.make(func=CtrlMoveToFunction.POSITION_PERCENT, position=opts.percent)
     sent = SomfyMessage(msgid=SomfyMessageId.CTRL_MOVETO, need_ack=True,
                         from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
                         to_node_type=NodeType.TYPE_ALL, to_addr=addr, payload=payload)
@@ -97,7 +96,7 @@ async def do_move_ip(connector, opts, move_down):
         await send_with_ack(addr, connector, sent)
     except SomfyNackException as e:
         if e.nack().get_nack_code() == SomfyNackReason.NACK_LAST_IP_REACHED:
-            opts.percent = 100 if move_down else 0.0
+            opts.percent = 100 if move_down else 0
             await do_move(connector, opts)
             return
 
@@ -135,7 +134,6 @@ async def do_invert(connector: SomfyConnector, opts):
     else:
         new_payload = MotorRotationDirectionPayload.make(direction=MotorRotationDirection.STANDARD)
 
-    addr = SomfyAddress.make(opts.addr)
     change = SomfyMessage(msgid=SomfyMessageId.SET_MOTOR_ROTATION_DIRECTION, need_ack=True,
                           from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
                           to_node_type=NodeType.TYPE_ALL, to_addr=addr, payload=new_payload)
@@ -151,7 +149,7 @@ async def force_updown(connector: SomfyConnector, opts, move_down):
 
     addr = SomfyAddress.make(opts.addr)
     payload = CtrlMoveForcedPayload.make(direction=SomfyDirection.DOWN if move_down else SomfyDirection.UP,
-                                         tens_of_ms=int(opts.millis) // 10)
+                                         tens_of_ms=opts.millis // 10)
     forced = SomfyMessage(msgid=SomfyMessageId.CTRL_MOVE_FORCED, need_ack=True,
                           from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
                           to_node_type=NodeType.TYPE_ALL, to_addr=addr, payload=payload)
@@ -183,6 +181,8 @@ async def run(opts, cmd):
         host, port = opts.tcp.split(":")
         ch = SocketConnectionFactory(host=host, port=port)
     elif opts.serial:
+        # Don't pay for importing pyserial unless it's needed
+        from somfy.serial import SerialConnectionFactory
         ch = SerialConnectionFactory(opts.serial)
     else:
         raise Exception("Neither --tcp nor --serial options specified")
@@ -215,20 +215,24 @@ async def run(opts, cmd):
 
 
 if __name__ == '__main__':
-    parser = OptionParser(
-        "sdntool.py [options] detect|info|move|stop|down_step|up_step|"
-        "invert_direction|force_down|force_up|set_lower_limit|set_upper_limit")
-    parser.add_option("--tcp", dest="tcp",
-                      help="use the TCP endpoint for the Somfy connection (host:port)")
-    parser.add_option("--serial", dest="serial",
-                      help="use directly attached RS-485 serial device (/dev/tty<...>)")
-    parser.add_option("--addr", dest="addr", help="The Somfy device address")
-    parser.add_option("--percent", dest="percent", help="The percentage (0-100) for the move command")
-    parser.add_option("--millis", dest="millis", help="The number of milliseconds for the forced move commands")
-    (options, args) = parser.parse_args()
-
-    if len(args) == 0:
-        parser.print_usage()
-        exit(1)
-
-    asyncio.run(run(options, args[0]))
+    parser = ArgumentParser(description="Detect and control the SDN devices")
+    parser.add_argument("command", choices=["detect", "info", "move", "stop", "down_step", "up_step",
+                                            "invert_direction", "force_down", "force_up",
+                                            "set_lower_limit", "set_upper_limit"])
+    parser.add_argument("--tcp", dest="tcp",
+                        help="use the TCP endpoint for the Somfy connection (host:port)")
+    parser.add_argument("--serial", dest="serial",
+                        help="use directly attached RS-485 serial device (/dev/tty<...>)")
+    parser.add_argument("--addr", dest="addr", help="The Somfy device address")
+    parser.add_argument("--percent", dest="percent", type=int, help="The percentage (0-100) for the move command")
+    parser.add_argument("--millis", dest="millis", type=int,
+                        help="The number of milliseconds for the forced move commands")
+    options = parser.parse_args()
+
+    try:
+        # uvloop is optional (and not available on Windows), fall back to the default asyncio loop
+        from uvloop import new_event_loop
+    except ImportError:
+        new_event_loop = None
+
+    asyncio.run(run(options, options.command), loop_factory=new_event_loop)
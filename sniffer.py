@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 import asyncio
-import json
-from optparse import OptionParser
+import sys
+from argparse import ArgumentParser
+from collections import deque
 from typing import Optional
 
 from somfy.connector import SomfyConnector, SocketConnectionFactory, ReconnectingSomfyConnector
 from somfy.messages import SomfyMessage, SomfyAddress
-from somfy.serial import SerialConnectionFactory
+from somfy.output import format_message
+
+# The received messages are printed in batches
+OUTPUT_FLUSH_INTERVAL_SEC = 0.05
+
+
+def flush_messages(pending: deque[SomfyMessage], as_json, as_dict):
+    if not pending:
+        return
+    lines = [format_message(pending.popleft(), as_json, as_dict) for _ in range(len(pending))]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+async def print_messages(pending: deque[SomfyMessage], as_json, as_dict):
+    try:
+        while True:
+            await asyncio.sleep(OUTPUT_FLUSH_INTERVAL_SEC)
+            flush_messages(pending, as_json, as_dict)
+    finally:
+        flush_messages(pending, as_json, as_dict)
 
 
 async def sniff(opts):
@@ -14,6 +35,8 @@ async def sniff(opts):
         host, port = opts.tcp.split(":")
         ch = SocketConnectionFactory(host=host, port=port)
     elif opts.serial:
+        # Don't pay for importing pyserial unless it's needed
+        from somfy.serial import SerialConnectionFactory
         ch = SerialConnectionFactory(opts.serial)
     else:
         raise Exception("Neither --tcp nor --serial options specified")
@@ -22,34 +45,42 @@ async def sniff(opts):
     if opts.addr:
         addr = SomfyAddress.make(opts.addr)
 
+    # The messages are formatted by the printer task, off the bus draining path
+    pending = deque[SomfyMessage]()
+
     def on_message(msg: SomfyMessage):
         if addr and (msg.from_addr != addr and msg.to_addr != addr):
             return
-        if opts.as_dict:
-            print(msg.as_dict())
-        elif opts.as_json:
-            print(json.dumps(msg.as_dict(), sort_keys=True, default=lambda o: o.to_json()))
-        else:
-            print(msg.__str__())
+        pending.append(msg)
 
-    async with ReconnectingSomfyConnector(ch, sniffer_callback=on_message) as conn:
-        try:
-            await conn.done_notification().wait()
-        except asyncio.CancelledError:
-            pass
+    printer = asyncio.create_task(print_messages(pending, opts.as_json, opts.as_dict))
+    try:
+        async with ReconnectingSomfyConnector(ch, sniffer_callback=on_message) as conn:
+            try:
+                await conn.done_notification().wait()
+            except asyncio.CancelledError:
+                pass
+    finally:
+        printer.cancel()
 
 
 if __name__ == '__main__':
-    parser = OptionParser("sniffer.py [options]")
-    parser.add_option("--tcp", dest="tcp",
-                      help="use the TCP endpoint for the Somfy connection (host:port)")
-    parser.add_option("--serial", dest="serial",
-                      help="use directly attached RS-485 serial device (/dev/tty<...>)")
-    parser.add_option("--addr", dest="addr", help="The Somfy source/dest device address")
-    parser.add_option("-j", "--json", action="store_true", dest="as_json",
-                      help="use JSON output")
-    parser.add_option("-d", "--dict", action="store_true", dest="as_dict",
-                      help="use augmented dict output")
-    (options, args) = parser.parse_args()
-
-    asyncio.run(sniff(options))
+    parser = ArgumentParser(description="Listen to the SDN bus traffic")
+    parser.add_argument("--tcp", dest="tcp",
+                        help="use the TCP endpoint for the Somfy connection (host:port)")
+    parser.add_argument("--serial", dest="serial",
+                        help="use directly attached RS-485 serial device (/dev/tty<...>)")
+    parser.add_argument("--addr", dest="addr", help="The Somfy source/dest device address")
+    parser.add_argument("-j", "--json", action="store_true", dest="as_json",
+                        help="use JSON output")
+    parser.add_argument("-d", "--dict", action="store_true", dest="as_dict",
+                        help="use augmented dict output")
+    options = parser.parse_args()
+
+    try:
+        # uvloop is optional (and not available on Windows), fall back to the default asyncio loop
+        from uvloop import new_event_loop
+    except ImportError:
+        new_event_loop = None
+
+    asyncio.run(sniff(options), loop_factory=new_event_loop)
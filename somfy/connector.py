@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from asyncio import events, StreamReader, StreamWriter, Future, InvalidStateError
+from asyncio import events, StreamReader, StreamWriter, Future
 from types import TracebackType
 from typing import List, Optional, Type, Callable, Tuple, override
 
@@ -13,6 +13,10 @@ from somfy.messages import SomfyMessage, SomfyMessageId, NodeType, MASTER_ADDRES
 COMMUNICATION_TIMEOUT_SEC = 1.0
 # The time the MASTER node needs to wait after the last bus activity (see page 9)
 BUS_QUIET_TIME_SEC = 0.025  # 25 milliseconds
+# The maximum number of bytes to read from the channel at once
+READ_CHUNK_SIZE = 4096
+# The writes only wait for the transport to flush the data once this much data is buffered
+WRITE_BUFFER_DRAIN_SIZE = 4096
 
 
 class BackoffPolicy(object):
@@ -25,11 +29,15 @@ class BackoffPolicy(object):
         self.cur_retry = 0
 
     def get_wait_time_sec_after_a_failure(self) -> float:
-        if self.cur_retry <= 0:
-            self.cur_retry += 1
+        cur_retry = self.cur_retry
+        if cur_retry <= 0:
+            self.cur_retry = 1
             return 0
-        res = min(self.max_wait, 2 ** (self.cur_retry - 1))
-        self.cur_retry += 1
+        res = 1 << (cur_retry - 1)
+        if res >= self.max_wait:
+            # Stop counting the retries once the wait time is capped, the bus might stay dead for a long time
+            return self.max_wait
+        self.cur_retry = cur_retry + 1
         return res
 
 
@@ -39,6 +47,22 @@ class ConnectionFactory(ABC):
         pass
 
 
+# The stream protocol that receives the data into a preallocated buffer, instead of getting a new bytes object
+# for each received chunk. The data is copied straight into the stream reader's buffer.
+class _BufferedStreamReaderProtocol(asyncio.StreamReaderProtocol, asyncio.BufferedProtocol):
+    def __init__(self, stream_reader: StreamReader, loop: asyncio.AbstractEventLoop):
+        super().__init__(stream_reader, loop=loop)
+        self._recv_buffer = memoryview(bytearray(READ_CHUNK_SIZE))
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes: int):
+        reader = self._stream_reader
+        if reader is not None:
+            reader.feed_data(self._recv_buffer[:nbytes])
+
+
 class SocketConnectionFactory(ConnectionFactory):
     def __init__(self, host: str, port: int):
         self.host = host
@@ -48,34 +72,41 @@ class SocketConnectionFactory(ConnectionFactory):
     async def connect(self) -> (StreamReader, StreamWriter):
         loop = events.get_running_loop()
         reader = asyncio.StreamReader(loop=loop)
-        protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_connection(protocol_factory=lambda: protocol, host=self.host, port=self.port)
         writer = asyncio.StreamWriter(transport, protocol, reader, loop)
         return reader, writer
 
 
 class _Channel(object):
+    __slots__ = ('last_activity', 'connect_lock', 'connection_factory', 'loop', 'writer', 'reader', 'unread')
+
     def __init__(self, connection_factory: ConnectionFactory):
         self.last_activity = 0
-        self.lock = asyncio.Lock()
+        # The I/O is serialized by the connector's channel lock, this lock only protects opening and closing
+        # the connection.
+        self.connect_lock = asyncio.Lock()
         self.connection_factory = connection_factory
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.writer: Optional[StreamWriter] = None
         self.reader: Optional[StreamReader] = None
+        # The data that was read from the stream, but was given back with `unread_bytes`
+        self.unread: bytes = b''
 
     async def start(self):
-        async with self.lock:
+        async with self.connect_lock:
             if self.writer is None:
+                self.loop = asyncio.get_running_loop()
                 self.reader, self.writer = await self.connection_factory.connect()
 
     def is_closed(self) -> bool:
         return self.writer is None
 
     async def close(self):
-        writer = self.writer
-        if writer is not None:
-            # Terminate any pending reads/writes
-            writer.close()
-        async with self.lock:
+        # Terminate any pending reads/writes
+        self._do_close()
+        # Wait for the connection that might be being opened right now
+        async with self.connect_lock:
             self._do_close()
 
     def _do_close(self):
@@ -84,55 +115,129 @@ class _Channel(object):
             self.writer = None
             self.reader = None
 
-    async def read_byte(self) -> int:
-        async with self.lock:
-            if self.is_closed():
-                raise IOError("Channel is closed")
+    # Read up to `max_n` bytes, returns whatever is already buffered without waiting for more data. Waits
+    # for at least one byte if the buffer is empty.
+    async def read_bytes(self, max_n: int = READ_CHUNK_SIZE) -> bytes:
+        if self.unread:
+            chunk = self.unread[:max_n]
+            self.unread = self.unread[max_n:]
+            return chunk
 
-            loop = asyncio.get_running_loop()
-            try:
-                chunk = await self.reader.readexactly(1)
-            except asyncio.TimeoutError:
-                # Nothing special for timeouts
-                raise
-            except asyncio.CancelledError:
-                # Nothing special for cancels
-                raise
-            except BaseException as exc:
-                self._do_close()
-                raise
-            self.last_activity = loop.time()
-            return chunk[0]
-
-    async def write_bytes(self, data: List[int]):
-        async with self.lock:
-            if self.is_closed():
-                raise IOError("Channel is closed")
+        if self.is_closed():
+            raise IOError("Channel is closed")
 
-            loop = asyncio.get_running_loop()
-            try:
-                self.writer.write(bytes(data))
-                await self.writer.drain()
-            except Exception:
-                self._do_close()
-                raise
-            self.last_activity = loop.time()
+        try:
+            chunk = await self.reader.read(max_n)
+        except asyncio.TimeoutError:
+            # Nothing special for timeouts
+            raise
+        except asyncio.CancelledError:
+            # Nothing special for cancels
+            raise
+        except BaseException as exc:
+            self._do_close()
+            raise
+        if not chunk:
+            # EOF, the other side has closed the connection
+            self._do_close()
+            raise asyncio.IncompleteReadError(partial=b'', expected=1)
+        self.last_activity = self.loop.time()
+        return chunk
+
+    # Give back the data that was read but not consumed, it will be returned by the next `read_bytes`
+    def unread_bytes(self, data: bytes):
+        self.unread = data + self.unread
+
+    async def write_bytes(self, data: bytes):
+        if self.is_closed():
+            raise IOError("Channel is closed")
+
+        try:
+            writer = self.writer
+            writer.write(data)
+            # The SDN frames are tiny, so there's no need to wait for the transport unless the data piles up
+            if writer.transport.get_write_buffer_size() >= WRITE_BUFFER_DRAIN_SIZE:
+                await writer.drain()
+        except Exception:
+            self._do_close()
+            raise
+        self.last_activity = self.loop.time()
+
+    # Write several frames at once
+    async def write_many(self, frames: List[bytes]):
+        if self.is_closed():
+            raise IOError("Channel is closed")
+
+        try:
+            writer = self.writer
+            writer.writelines(frames)
+            if writer.transport.get_write_buffer_size() >= WRITE_BUFFER_DRAIN_SIZE:
+                await writer.drain()
+        except Exception:
+            self._do_close()
+            raise
+        self.last_activity = self.loop.time()
+
+    # Wait until the written data is passed to the transport
+    async def flush(self):
+        if self.is_closed():
+            raise IOError("Channel is closed")
+
+        try:
+            await self.writer.drain()
+        except Exception:
+            self._do_close()
+            raise
 
     def get_last_activity(self):
         return self.last_activity
 
 
+# Complete the future, unless it's already done. Checking first is cheaper than catching InvalidStateError.
+def _settle(future: Future, result=None):
+    if not future.done():
+        future.set_result(result)
+
+
+# Signals the drainer that somebody needs the channel for a message exchange. Unlike `asyncio.Event`, the drainer
+# waits on the same future across all the drain iterations, without registering a new waiter each time.
+class _TalkRequest(object):
+    __slots__ = ('future',)
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+
+    def wait_future(self) -> Future:
+        if self.future is None:
+            self.future = asyncio.get_running_loop().create_future()
+        return self.future
+
+    def set(self):
+        _settle(self.wait_future())
+
+    def clear(self):
+        # Rotate the future, the completed one can't be reset
+        if self.future is not None and self.future.done():
+            self.future = None
+
+
 # This class runs as a background task of the communicator, making sure that the TCP connection does not
 # get blocked once the read buffer overflows. It additionally can attempt to parse the bus traffic and
 # look for valid Somfy SDN messages.
 class _Drainer(object):
-    def __init__(self, channel: _Channel, lock: asyncio.Lock, need_to_talk: asyncio.Event, done_notifier: asyncio.Event,
+    __slots__ = ('channel', 'lock', 'need_to_talk', 'sniffer_callback', 'listeners', 'message_recognizer',
+                 'done_notifier')
+
+    def __init__(self, channel: _Channel, lock: asyncio.Lock, need_to_talk: _TalkRequest, done_notifier: asyncio.Event,
+                 recognizer: MessageRecognizer, listeners: List[Callable[[SomfyMessage], None]],
                  sniffer_callback: Callable[[SomfyMessage], None] = None):
         self.channel = channel
         self.lock = lock
         self.need_to_talk = need_to_talk
         self.sniffer_callback = sniffer_callback
-        self.message_recognizer = MessageRecognizer()
+        # The listeners are owned by the connector, and can come and go while the drainer is running
+        self.listeners = listeners
+        self.message_recognizer = recognizer
         self.done_notifier = done_notifier
 
     async def run_loop(self):
@@ -146,55 +251,109 @@ class _Drainer(object):
             self.done_notifier.set()
 
     async def attempt_drain(self):
+        channel = self.channel
+        # The loop is cached by the channel when it's started
+        loop = channel.loop
+        quiet_time = BUS_QUIET_TIME_SEC
+        need_to_talk = self.need_to_talk
+        sniffer_callback = self.sniffer_callback
+        listeners = self.listeners
+        message_recognizer = self.message_recognizer
+        add_bytes = message_recognizer.add_bytes
         async with self.lock:
-            # Loop until we are requested to relinquish the channel lock
-            while True:
-                wait_set = []
-
-                byte_reader = asyncio.ensure_future(self.channel.read_byte())
-                wait_set.append(byte_reader)
-
-                # The SDN docs say that we need to wait for at least BUS_QUIET_TIME (25ms) before starting
-                # any other activity. So we don't allow the bus lock to be relinquished until this timeout expires.
-                bus_quiet_time_so_far = asyncio.get_running_loop().time() - self.channel.get_last_activity()
-                timeout = None
-                needs_to_relinquish_lock = None
-                if bus_quiet_time_so_far < BUS_QUIET_TIME_SEC:
-                    timeout = BUS_QUIET_TIME_SEC - bus_quiet_time_so_far
-                else:
-                    # We only allow the lock to be relinquished if we are not waiting for the bus quiet time
-                    # to expire. This quiet time includes our own traffic and the 3-rd party traffic.
-                    needs_to_relinquish_lock = asyncio.ensure_future(self.need_to_talk.wait())
-                    wait_set.append(needs_to_relinquish_lock)
+            # The recognizer is shared with the exchanges. The bus is quiet when the channel changes hands, so
+            # there's no partially received message to keep.
+            message_recognizer.reset()
+            # The exchanges might have updated the activity time while we didn't hold the lock
+            last_activity = channel.get_last_activity()
+            # The reader is kept alive across the iterations until it gets some data
+            byte_reader: Optional[asyncio.Task] = None
+            try:
+                # Loop until we are requested to relinquish the channel lock
+                while True:
+                    if byte_reader is None:
+                        # Eager tasks run synchronously until the first suspension, so the bytes that are already
+                        # buffered in the stream reader are returned without a round-trip through the event loop.
+                        byte_reader = asyncio.eager_task_factory(loop, channel.read_bytes())
+
+                    # The SDN docs say that we need to wait for at least BUS_QUIET_TIME (25ms) before starting
+                    # any other activity. So we don't allow the bus lock to be relinquished until this timeout
+                    # expires.
+                    bus_quiet_time_so_far = loop.time() - last_activity
+                    needs_to_relinquish_lock = None
+                    if bus_quiet_time_so_far < quiet_time:
+                        if not byte_reader.done():
+                            try:
+                                # Shield the reader, so it survives the timeout
+                                await asyncio.wait_for(asyncio.shield(byte_reader),
+                                                       quiet_time - bus_quiet_time_so_far)
+                            except TimeoutError:
+                                continue
+                    else:
+                        # We only allow the lock to be relinquished if we are not waiting for the bus quiet time
+                        # to expire. This quiet time includes our own traffic and the 3-rd party traffic.
+                        needs_to_relinquish_lock = need_to_talk.wait_future()
+                        if not byte_reader.done() and not needs_to_relinquish_lock.done():
+                            await _wait_for_either(loop, byte_reader, needs_to_relinquish_lock)
+
+                    if byte_reader.done():
+                        # We got incoming data, so the next statement won't block!
+                        data = byte_reader.result()
+                        byte_reader = None
+                        last_activity = channel.last_activity
+                        # Without the callbacks, we just drain the data
+                        if sniffer_callback is not None or listeners:
+                            for msg, _ in add_bytes(data):
+                                if sniffer_callback is not None:
+                                    sniffer_callback(msg)
+                                # The listeners might remove themselves when called
+                                for listener in tuple(listeners):
+                                    listener(msg)
+
+                    if needs_to_relinquish_lock is not None and needs_to_relinquish_lock.done():
+                        # The main thread wants to do a message exchange, give up the ownership of the lock
+                        break
+            finally:
+                if byte_reader is not None:
+                    byte_reader.cancel()
+                    # Let the reader unwind before giving up the lock, the stream reader doesn't allow
+                    # another read while the cancelled one is still waiting for data.
+                    await asyncio.wait((byte_reader,))
 
-                try:
-                    _, undone = await asyncio.wait(wait_set, return_when=asyncio.FIRST_COMPLETED, timeout=timeout)
-                    for u in undone:
-                        u.cancel()
-                except BaseException:
-                    for i in wait_set:
-                        i.cancel()
-                    raise
-
-                if byte_reader.done():
-                    # We got incoming data, so the next statement won't block!
-                    data_byte = await byte_reader
-                    if self.sniffer_callback is not None:
-                        msg = self.message_recognizer.add_data(data_byte)
-                        if msg is not None:
-                            self.sniffer_callback(msg)
-
-                if needs_to_relinquish_lock is not None and needs_to_relinquish_lock.done():
-                    # The main thread wants to do a message exchange, give up the ownership of the lock
-                    break
+
+# Wait until one of the futures completes. This is a cheaper version of `asyncio.wait` with FIRST_COMPLETED,
+# it doesn't need to allocate the sets of done/pending futures.
+async def _wait_for_either(loop: asyncio.AbstractEventLoop, first: Future, second: Future):
+    waiter = loop.create_future()
+
+    def wake_up(_):
+        _settle(waiter)
+
+    first.add_done_callback(wake_up)
+    second.add_done_callback(wake_up)
+    try:
+        await waiter
+    finally:
+        first.remove_done_callback(wake_up)
+        second.remove_done_callback(wake_up)
 
 
 class SomfyExchanger(ABC):
+    # Empty slots keep the subclasses that define their own slots free of the instance dict
+    __slots__ = ()
+
     @abstractmethod
     async def exchange(self, to_send: Optional[SomfyMessage],
                        msg_consumer: Optional[Callable[[SomfyMessage], bool]]) -> bool:
         pass
 
+    # Same as `exchange`, but sends several messages at once. The messages are sent back-to-back, without the bus
+    # quiet time between them.
+    @abstractmethod
+    async def exchange_many(self, to_send: List[SomfyMessage],
+                            msg_consumer: Optional[Callable[[SomfyMessage], bool]]):
+        pass
+
     @abstractmethod
     async def start(self):
         pass
@@ -211,17 +370,32 @@ class SomfyExchanger(ABC):
     def done_notification(self) -> asyncio.Event:
         pass
 
+    # Register a callback for the messages that are received outside the exchanges, e.g. the messages that
+    # the devices send on their own. The exchangers that don't watch the bus traffic never call the listeners.
+    def add_listener(self, listener: Callable[[SomfyMessage], None]):
+        pass
+
+    def remove_listener(self, listener: Callable[[SomfyMessage], None]):
+        pass
+
 
 class SomfyConnector(SomfyExchanger):
-    channel: _Channel = None
+    __slots__ = ('channel', 'channel_lock', 'need_to_talk', 'pending_exchanges', 'done_notify', 'drainer', 'timeout',
+                 'last_write_time', 'drainer_task', '_started', 'recognizer', 'listeners')
 
     def __init__(self, connection_factory: ConnectionFactory, sniffer_callback: Callable[[SomfyMessage], None] = None):
         self.channel = _Channel(connection_factory)
-        self.reader_lock = asyncio.Lock()
-        self.need_to_talk = asyncio.Event()
-        self.writer_lock = asyncio.Lock()
+        # The lock is held by the drainer, or by the current exchange
+        self.channel_lock = asyncio.Lock()
+        self.need_to_talk = _TalkRequest()
+        # The number of exchanges that are running or waiting for the channel
+        self.pending_exchanges = 0
         self.done_notify = asyncio.Event()
-        self.drainer = _Drainer(self.channel, self.reader_lock, self.need_to_talk, self.done_notify, sniffer_callback)
+        # The drainer and the exchanges are serialized by the channel lock, so they share the recognizer
+        self.recognizer = MessageRecognizer()
+        self.listeners = list[Callable[[SomfyMessage], None]]()
+        self.drainer = _Drainer(self.channel, self.channel_lock, self.need_to_talk, self.done_notify,
+                                self.recognizer, self.listeners, sniffer_callback)
         self.timeout = COMMUNICATION_TIMEOUT_SEC
         self.last_write_time = 0
         self.drainer_task: Optional[asyncio.Task] = None
@@ -245,7 +419,10 @@ class SomfyConnector(SomfyExchanger):
     async def start(self):
         await self.channel.start()
         assert self.drainer_task is None
-        self.drainer_task = asyncio.create_task(name="SDNBusDrainer", coro=self.drainer.run_loop())
+        # Start the drainer eagerly, so that it's already inside its cancellation handler if we get stopped
+        # right away.
+        self.drainer_task = asyncio.eager_task_factory(asyncio.get_running_loop(), self.drainer.run_loop(),
+                                                       name="SDNBusDrainer")
         self._started = True
 
     @override
@@ -261,6 +438,14 @@ class SomfyConnector(SomfyExchanger):
     def done_notification(self) -> asyncio.Event:
         return self.done_notify
 
+    @override
+    def add_listener(self, listener: Callable[[SomfyMessage], None]):
+        self.listeners.append(listener)
+
+    @override
+    def remove_listener(self, listener: Callable[[SomfyMessage], None]):
+        self.listeners.remove(listener)
+
     # Run the message exchange. `msg_consumer` callback is called for each message, it should return `True` if
     # it wants the exchange to continue. If `msg_consumer` is not specified, the method will not attempt
     # to read the data.
@@ -268,34 +453,49 @@ class SomfyConnector(SomfyExchanger):
     @override
     async def exchange(self, to_send: Optional[SomfyMessage],
                        msg_consumer: Optional[Callable[[SomfyMessage], bool]]):
-        async with self.writer_lock:
-            if self.done_notify.is_set():
-                raise Exception("Reader channel is closed")
-            # Signal the drainer task that we want to talk with the SDN network and that it needs to stop
-            # draining the data.
-            self.need_to_talk.set()
-            try:
-                async with self.reader_lock:
-                    async with asyncio.timeout(self.timeout):
-                        await self._do_exchange(to_send, msg_consumer)
-            finally:
+        await self.exchange_many([to_send] if to_send is not None else [], msg_consumer)
+
+    @override
+    async def exchange_many(self, to_send: List[SomfyMessage],
+                            msg_consumer: Optional[Callable[[SomfyMessage], bool]]):
+        if self.done_notify.is_set():
+            raise Exception("Reader channel is closed")
+        # Signal the drainer task that we want to talk with the SDN network and that it needs to stop
+        # draining the data. The lock is fair, so the drainer will queue up behind the waiting exchanges
+        # once it gives up the channel.
+        self.pending_exchanges += 1
+        self.need_to_talk.set()
+        try:
+            async with self.channel_lock:
+                async with asyncio.timeout(self.timeout):
+                    await self._do_exchange(to_send, msg_consumer)
+        finally:
+            self.pending_exchanges -= 1
+            if self.pending_exchanges == 0:
                 self.need_to_talk.clear()
 
-    async def _do_exchange(self, to_send: Optional[SomfyMessage],
+    async def _do_exchange(self, to_send: List[SomfyMessage],
                            msg_consumer: Optional[Callable[[SomfyMessage], bool]]):
-        if to_send is not None:
-            await self.channel.write_bytes(to_send.serialize())
+        if len(to_send) == 1:
+            await self.channel.write_bytes(to_send[0].serialize())
+        elif to_send:
+            await self.channel.write_many([msg.serialize() for msg in to_send])
 
         if not msg_consumer:
             return
 
-        recognizer = MessageRecognizer()
+        # Make sure the request is out before waiting for the replies
+        await self.channel.flush()
+        recognizer = self.recognizer
+        recognizer.reset()
         while True:
-            bt = await self.channel.read_byte()
-            msg = recognizer.add_data(bt)
-            if msg is not None:
+            # Only wait for the channel once the already received data is consumed
+            data = await self.channel.read_bytes()
+            for msg, end in recognizer.add_bytes(data):
                 keep_going = msg_consumer(msg)
                 if not keep_going:
+                    # Leave the rest of the data for the drainer
+                    self.channel.unread_bytes(data[end:])
                     return
 
 
@@ -316,6 +516,8 @@ class ReconnectingSomfyConnector(SomfyExchanger):
         self._started = False
         self.startup_complete = asyncio.Event()
         self.logger = logger
+        # The listeners are moved over to each new connector
+        self.listeners = list[Callable[[SomfyMessage], None]]()
 
     async def __aenter__(self) -> "ReconnectingSomfyConnector":
         # We don't need to open the channel here, the drainer will do that for us in background
@@ -344,8 +546,6 @@ class ReconnectingSomfyConnector(SomfyExchanger):
             try:
                 if self.connector is not None:
                     await self.connector.stop()
-            except InvalidStateError:
-                pass
             finally:
                 self.done_notify.set()
 
@@ -356,6 +556,18 @@ class ReconnectingSomfyConnector(SomfyExchanger):
     def startup_complete_notification(self) -> asyncio.Event:
         return self.startup_complete
 
+    @override
+    def add_listener(self, listener: Callable[[SomfyMessage], None]):
+        self.listeners.append(listener)
+        if self.connector is not None:
+            self.connector.add_listener(listener)
+
+    @override
+    def remove_listener(self, listener: Callable[[SomfyMessage], None]):
+        self.listeners.remove(listener)
+        if self.connector is not None:
+            self.connector.remove_listener(listener)
+
     async def _reconnect(self):
         while not asyncio.current_task().cancelling():
             # Wait for the connector to signal that it's done (due to an error)
@@ -371,6 +583,8 @@ class ReconnectingSomfyConnector(SomfyExchanger):
         async with self.lock:
             while not asyncio.current_task().cancelling():
                 connector = SomfyConnector(self.connection_factory, self.sniffer_callback)
+                for listener in self.listeners:
+                    connector.add_listener(listener)
                 # noinspection PyBroadException
                 try:
                     await connector.start()
@@ -391,6 +605,14 @@ class ReconnectingSomfyConnector(SomfyExchanger):
             async with self.lock:
                 await self.connector.exchange(to_send, msg_consumer)
 
+    @override
+    async def exchange_many(self, to_send: List[SomfyMessage],
+                            msg_consumer: Optional[Callable[[SomfyMessage], bool]]):
+        async with asyncio.timeout(self.timeout):
+            await self.startup_complete.wait()
+            async with self.lock:
+                await self.connector.exchange_many(to_send, msg_consumer)
+
 
 async def fire_and_forget(conn: SomfyExchanger, to_send: SomfyMessage):
     await conn.exchange(to_send, None)
@@ -423,19 +645,27 @@ async def detect_devices(conn: SomfyExchanger,
 # Unlike `exchange_one`, this method simply returns None on timeout
 async def try_to_exchange_one(conn: SomfyExchanger, addr: SomfyAddress, msgid: SomfyMessageId,
                               expected_reply: SomfyMessageId,
-                              payload: Optional[SomfyPayload] = SomfyPayload([])) -> Optional[SomfyMessage]:
+                              payload: Optional[SomfyPayload] = SomfyPayload(b'')) -> Optional[SomfyMessage]:
+    sent = SomfyMessage(msgid=msgid, from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
+                        to_node_type=NodeType.TYPE_ALL, to_addr=addr, payload=payload)
+    return await try_to_exchange(conn, sent, expected_reply)
+
+
+# Send the prebuilt message and wait for the reply from its destination, returns None on timeout. Useful
+# for the repeated polling, as the message is serialized only once.
+async def try_to_exchange(conn: SomfyExchanger, sent: SomfyMessage,
+                          expected_reply: SomfyMessageId) -> Optional[SomfyMessage]:
     result: Optional[SomfyMessage] = None
+    addr = sent.to_addr
 
     def filter_type(msg: SomfyMessage):
-        found_reply = msg.from_addr == addr and msg.msgid == expected_reply
+        found_reply = msg.msgid == expected_reply and msg.from_addr == addr
         if found_reply:
             nonlocal result
             result = msg
             return False
         return True
 
-    sent = SomfyMessage(msgid=msgid, from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
-                        to_node_type=NodeType.TYPE_ALL, to_addr=addr, payload=payload)
     try:
         await conn.exchange(sent, filter_type)
     except asyncio.TimeoutError:
@@ -7,11 +7,10 @@ class IntEnumWithStr(IntEnum):
         return self.name
 
 
+# Look up the enum member directly in the value map, the unknown values (which are common when sniffing a noisy bus)
+# don't need to go through raising and catching ValueError.
 def enum_or_int[T](enum_type: Type[T], val: int) -> T | int:
-    try:
-        return enum_type(val)
-    except ValueError:
-        return val
+    return enum_type._value2member_map_.get(val, val)
 
 
 def hex_enum(val: IntEnum | int) -> str:
@@ -1,5 +1,6 @@
 # Messages specification
 from binascii import unhexlify
+from functools import lru_cache
 from typing import List, Optional, Any
 
 from somfy.enumutils import enum_or_int, hex_enum, IntEnumWithStr
@@ -86,21 +87,41 @@ class SomfyMessageId(IntEnumWithStr):
 
 
 # Somfy SDN node address, they are unique within a given Somfy network. 3 bytes.
+# The parsed addresses are interned (there are just a handful of devices on a bus), so the comparisons of the
+# addresses from the received messages are typically resolved by the identity check.
 class SomfyAddress(object):
+    __slots__ = ('a', 'b', 'c', '_hash', '_str')
+
     def __init__(self, a: int, b: int, c: int):
         self.a = a
         self.b = b
         self.c = c
+        self._hash = hash((a, b, c))
+        self._str = "%02X%02X%02X" % (a, b, c)
+
+    # Get the interned address. The cache is bounded, as the bus noise can produce messages with random addresses.
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get(a: int, b: int, c: int) -> 'SomfyAddress':
+        return SomfyAddress(a, b, c)
 
     def serialize(self) -> List[int]:
-        res = [self.c, self.b, self.a]
-        return [f for f in res]
+        return [self.c, self.b, self.a]
+
+    # Write the serialized address into `buf` at the offset `off`
+    def serialize_into(self, buf: bytearray, off: int):
+        buf[off] = self.c
+        buf[off + 1] = self.b
+        buf[off + 2] = self.a
 
     def __str__(self) -> str:
-        return "%02X%02X%02X" % (self.a, self.b, self.c)
+        return self._str
 
     def __eq__(self, other):
-        return self.a == other.a and self.b == other.b and self.c == other.c
+        return self is other or (self.a == other.a and self.b == other.b and self.c == other.c)
+
+    def __hash__(self):
+        return self._hash
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -108,62 +129,77 @@ class SomfyAddress(object):
     def to_json(self):
         return self.__str__()
 
+    # Parse the serialized address from `raw_bytes` at the offset `off`, without slicing the buffer
     @classmethod
-    def parse_bytes(cls, raw_bytes) -> 'SomfyAddress':
-        return SomfyAddress(raw_bytes[2], raw_bytes[1], raw_bytes[0])
+    def parse_bytes(cls, raw_bytes, off: int = 0) -> 'SomfyAddress':
+        return SomfyAddress.get(raw_bytes[off + 2], raw_bytes[off + 1], raw_bytes[off])
 
     @staticmethod
     def make(addr: str) -> 'SomfyAddress':
         buf = unhexlify(addr)
         if len(buf) != 3:
             raise ValueError("Invalid address")
-        return SomfyAddress(buf[0], buf[1], buf[2])
+        return SomfyAddress.get(buf[0], buf[1], buf[2])
 
 
-MASTER_ADDRESS = SomfyAddress(0x7F, 0x7F, 0x7F)  # The MASTER node pseudo-address
-BROADCAST_ADDR = SomfyAddress(0xFF, 0xFF, 0xFF)  # Broadcast address, useful for node discovery
+MASTER_ADDRESS = SomfyAddress.get(0x7F, 0x7F, 0x7F)  # The MASTER node pseudo-address
+BROADCAST_ADDR = SomfyAddress.get(0xFF, 0xFF, 0xFF)  # Broadcast address, useful for node discovery
 
 
 # Message payload, see payloads.py for the list of typesafe wrappers
 class SomfyPayload(object):
-    expected_lengths: Optional[list[int]] = None
-
-    def __init__(self, content: List[int]):
-        for p in content:
-            if p < 0 or p > 255:
-                raise ValueError("Content should contain valid bytes")
+    __slots__ = ('content',)
+    # The valid payload lengths, set by the derived classes
+    expected_lengths: Optional[frozenset[int]] = None
+
+    # The content is stored as immutable bytes
+    def __init__(self, content: bytes | List[int]):
+        # bytes() would turn an int into that many zero bytes
+        if isinstance(content, int):
+            raise ValueError("Content should contain valid bytes")
+        # bytes() checks that the values are in the byte range
+        try:
+            content = bytes(content)
+        except (TypeError, ValueError):
+            raise ValueError("Content should contain valid bytes")
         if self.expected_lengths is not None and len(content) not in self.expected_lengths:
             raise ValueError("Invalid length")
         self.content = content
 
-    def serialize(self) -> List[int]:
+    def serialize(self) -> bytes:
         return self.content
 
+    # Write the serialized payload into `buf` at the offset `off`
+    def serialize_into(self, buf: bytearray, off: int):
+        buf[off:off + len(self.content)] = self.content
+
     # Override in derived classes to provide nicer info
     def as_dict(self):
         if len(self.content) == 0:
             return {}
-        return {"bytes": ''.join('{:02X} '.format(x) for x in self.content).strip()}
+        return {"bytes": self.content.hex(' ').upper()}
 
     def __str__(self):
         return str(self.as_dict())
 
 
-MESSAGE_PAYLOAD_MAP = dict[int, type]()
+# The message IDs are single bytes, so the payload types are indexed by the message ID directly
+MESSAGE_PAYLOAD_MAP: list[type | None] = [None] * 256
+
+# Translation table for bytes.translate, inverts all the bits in each byte
+INVERT_TABLE = bytes(~b & 0xFF for b in range(256))
 
 
 # Register typesafe wrappers for payloads
 def register_message_payloads(payloads: dict[int, type]):
-    global MESSAGE_PAYLOAD_MAP
     for k, v in payloads.items():
-        MESSAGE_PAYLOAD_MAP[k] = v
+        MESSAGE_PAYLOAD_MAP[int(k)] = v
 
 
 # Try to parse the payload for the given message id and create a typesafe wrapper, return a generic
 # SomfyPayload if the message can't be parsed.
-def attempt_to_parse_payload(msgid: SomfyMessageId | int, content: list[int]) -> SomfyPayload:
-    global MESSAGE_PAYLOAD_MAP
-    payload_class = MESSAGE_PAYLOAD_MAP.get(msgid, None)
+def attempt_to_parse_payload(msgid: SomfyMessageId | int, content: bytes) -> SomfyPayload:
+    payload_class = MESSAGE_PAYLOAD_MAP[msgid]
     if payload_class is None:
         return SomfyPayload(content)
     return payload_class(content)
@@ -190,10 +226,13 @@ def attempt_to_parse_payload(msgid: SomfyMessageId | int, content: list[int]) ->
 # The 16-bit payload values (such as the pulse counts) are apparently sent in the LSB order.
 ####################################################################################################
 class SomfyMessage(object):
+    __slots__ = ('msgid', 'from_node_type', 'from_addr', 'to_node_type', 'to_addr', 'need_ack', 'payload',
+                 '_serialized', '_str')
+
     def __init__(self, msgid: SomfyMessageId | int,
                  from_node_type: NodeType | int = NodeType.TYPE_ALL, from_addr: SomfyAddress = None,
                  to_node_type: NodeType | int = NodeType.TYPE_ALL, to_addr: SomfyAddress = None,
-                 need_ack: bool = False, payload: SomfyPayload = SomfyPayload([])):
+                 need_ack: bool = False, payload: SomfyPayload = SomfyPayload(b'')):
         self.msgid = enum_or_int(SomfyMessageId, msgid)
         self.from_node_type = enum_or_int(NodeType, from_node_type)
         self.from_addr = from_addr
@@ -201,44 +240,64 @@ class SomfyMessage(object):
         self.to_addr = to_addr
         self.need_ack = need_ack
         self.payload = payload
-
-    def serialize(self):
-        content_data = self.payload.serialize()
-        ack_flag = 0x80 if self.need_ack else 0x00
-        dest_type = int(self.from_node_type) << 4 | int(self.to_node_type)
-        res = ([self.msgid & 0xFF, (len(content_data) + 11) | ack_flag, dest_type] +
-               self.from_addr.serialize() + self.to_addr.serialize() + content_data)
+        self._serialized: Optional[bytes] = None
+        self._str: Optional[str] = None
+
+    # The serialized form is cached, so the messages must not be modified after they are sent
+    def serialize(self) -> bytes:
+        if self._serialized is None:
+            self._serialized = self._do_serialize()
+        return self._serialized
+
+    def _do_serialize(self) -> bytes:
+        payload = self.payload
+        msg_len = len(payload.content) + 11
+        # Lay out the message without the checksum
+        buf = bytearray(msg_len - 2)
+        buf[0] = self.msgid & 0xFF
+        buf[1] = msg_len | (0x80 if self.need_ack else 0x00)
+        buf[2] = self.from_node_type << 4 | self.to_node_type
+        self.from_addr.serialize_into(buf, 3)
+        self.to_addr.serialize_into(buf, 6)
+        payload.serialize_into(buf, 9)
         # Invert the message bytes before computing the checksum
-        for i in range(0, len(res)):
-            res[i] = ~res[i] & 0xFF
-        return bytes(res + self.compute_checksum(res))
+        buf = buf.translate(INVERT_TABLE)
+        buf += SomfyMessage._checksum_int(buf).to_bytes(2, 'big')
+        return bytes(buf)
 
     def as_dict(self) -> dict[str, Any]:
         return {"msgid": self.msgid, "from_node_type": self.from_node_type, "from_addr": self.from_addr,
                 "to_node_type": self.to_node_type, "to_addr": self.to_addr, "need_ack": self.need_ack,
                 "payload": self.payload.as_dict()}
 
+    # The text form is cached, just like the serialized one
     def __str__(self):
-        return (f"ID: {hex_enum(self.msgid)} FROM: {hex_enum(self.from_node_type)} {self.from_addr} "
-                f"TO: {hex_enum(self.to_node_type)} {self.to_addr} ACK: {self.need_ack} "
-                f"DATA: {self.payload}")
+        if self._str is None:
+            self._str = (f"ID: {hex_enum(self.msgid)} FROM: {hex_enum(self.from_node_type)} {self.from_addr} "
+                         f"TO: {hex_enum(self.to_node_type)} {self.to_addr} ACK: {self.need_ack} "
+                         f"DATA: {self.payload}")
+        return self._str
+
+    # Returns the checksum as the [high, low] pair of bytes
+    @staticmethod
+    def compute_checksum(msg) -> List[int]:
+        checksum = SomfyMessage._checksum_int(msg)
+        return [checksum >> 8, checksum & 0xFF]
 
+    # The checksum as a 16-bit integer, for the serialization and parsing
     @staticmethod
-    def compute_checksum(msg):
-        checksum = 0
-        for i in msg:
-            checksum += i
-        return [checksum // 256 & 0xFF, checksum % 256 & 0xFF]
+    def _checksum_int(msg) -> int:
+        return sum(msg) & 0xFFFF
 
     @staticmethod
-    def try_parse(data: List[int]) -> Optional['SomfyMessage']:
+    def try_parse(data: bytes | bytearray) -> Optional['SomfyMessage']:
         # Validate the checksum
-        checksum = SomfyMessage.compute_checksum(data[:-2])
-        if checksum[0] != data[-2] or checksum[1] != data[-1]:
+        checksum = SomfyMessage._checksum_int(memoryview(data)[:-2])
+        if checksum != data[-2] << 8 | data[-1]:
             return None  # Checksum mismatch
 
         # First, invert the data (except the checksum) to make parsing easier
-        inverted = [~i & 0xFF for i in data[:-2]]
+        inverted = data[:-2].translate(INVERT_TABLE)
 
         msg_id = enum_or_int(SomfyMessageId, inverted[0])
 
@@ -251,8 +310,8 @@ class SomfyMessage(object):
         from_node_type = enum_or_int(NodeType, inverted[2] >> 4 & 0xF)
         to_node_type = enum_or_int(NodeType, inverted[2] & 0xF)
 
-        from_addr = SomfyAddress.parse_bytes(inverted[3:6])
-        to_addr = SomfyAddress.parse_bytes(inverted[6:9])
+        from_addr = SomfyAddress.parse_bytes(inverted, 3)
+        to_addr = SomfyAddress.parse_bytes(inverted, 6)
 
         payload = inverted[9:]
         parsed_payload = attempt_to_parse_payload(msg_id, payload)
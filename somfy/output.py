@@ -0,0 +1,29 @@
+###############################################################################################
+# Text, JSON and dict formatting of the decoded messages, shared by the tools.
+###############################################################################################
+from somfy.messages import SomfyMessage
+
+
+def _to_json(o):
+    return o.to_json()
+
+
+# orjson is much faster at dumping the small message dicts, but it's optional
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=_to_json).decode()
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), default=_to_json)
+
+
+def format_message(msg: SomfyMessage, as_json: bool, as_dict: bool) -> str:
+    if as_dict:
+        return str(msg.as_dict())
+    elif as_json:
+        return json_dumps(msg.as_dict())
+    return msg.__str__()
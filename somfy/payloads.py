@@ -2,50 +2,58 @@
 # Typesafe wrappers for message payloads, based on the SDN Integration Guide
 # (and a bit of reverse engineering).
 ###############################################################################################
+import struct
 from typing import Optional, List, override
 
 from somfy.enumutils import enum_or_int, IntEnumWithStr
 from somfy.messages import SomfyPayload, SomfyMessageId, SomfyAddress, register_message_payloads
 
+# The 16-bit payload values are sent in the LSB order
+_U16_LE = struct.Struct("<H")
+
 
 class EmptyPayload(SomfyPayload):
-    expected_lengths = [0]
+    __slots__ = ()
+    expected_lengths = frozenset({0})
 
     def __init__(self, *ignored, **ignored_kwargs):
-        super().__init__([])
+        super().__init__(b'')
 
 
 class GroupAddrPayload(SomfyPayload):
-    expected_lengths = [4]
+    __slots__ = ()
+    expected_lengths = frozenset({4})
 
     def get_group_index(self):
         return self.content[0]
 
+    # The group ID is a 24-bit big-endian value
     def get_group_id(self):
-        return self.content[1] << 16 + self.content[2] << 8 + self.content[3]
+        return int.from_bytes(self.content[1:4], 'big')
 
     @override
     def as_dict(self):
-        return {"group_index": self.get_group_index(), "group_id": self.get_group_id()}
+        return {"group_index": self.content[0], "group_id": int.from_bytes(self.content[1:4], 'big')}
 
     @staticmethod
     def make(group_index: int, group_id: int) -> 'GroupAddrPayload':
-        return GroupAddrPayload([group_index, group_id >> 16 & 0xFF, group_id >> 8 & 0xFF, group_id & 0xFF])
+        return GroupAddrPayload(bytes((group_index,)) + (group_id & 0xFFFFFF).to_bytes(3, 'big'))
 
 
 class GroupIndexPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
     def get_group_index(self):
         return self.content[0]
 
     @override
     def as_dict(self):
-        return {"group_index": self.get_group_index()}
+        return {"group_index": self.content[0]}
 
     @staticmethod
     def make(group_index: int) -> 'GroupIndexPayload':
-        return GroupIndexPayload([group_index])
+        return GroupIndexPayload(bytes((group_index,)))
 
 
 # Some message processing fault reasons
@@ -78,22 +86,24 @@ class SomfyNackReason(IntEnumWithStr):
 
 
 class NackPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
     def get_nack_code(self) -> SomfyNackReason | int:
         return enum_or_int(SomfyNackReason, self.content[0])
 
     @override
     def as_dict(self):
-        return {"nack_code": self.get_nack_code()}
+        return {"nack_code": enum_or_int(SomfyNackReason, self.content[0])}
 
     @staticmethod
     def make(nack_code: SomfyNackReason | int) -> 'NackPayload':
-        return NackPayload([int(nack_code)])
+        return NackPayload(bytes((int(nack_code),)))
 
 
 class NodeAppVersionPayload(SomfyPayload):
-    expected_lengths = [6]
+    __slots__ = ()
+    expected_lengths = frozenset({6})
 
     @staticmethod
     def make(version: List[int]) -> 'NodeAppVersionPayload':
@@ -101,10 +111,11 @@ class NodeAppVersionPayload(SomfyPayload):
 
 
 class NodeLabelPayload(SomfyPayload):
-    expected_lengths = [16]
+    __slots__ = ()
+    expected_lengths = frozenset({16})
 
     def get_label(self):
-        return bytes(self.content).decode('utf-8').strip()
+        return self.content.rstrip(b'\x00 ').decode('utf-8')
 
     @override
     def as_dict(self):
@@ -115,7 +126,7 @@ class NodeLabelPayload(SomfyPayload):
         label_bytes = label.encode('utf-8')
         if len(label_bytes) > 16:
             raise ValueError("Label too long")
-        return NodeLabelPayload([b for b in label_bytes])
+        return NodeLabelPayload(label_bytes.ljust(16, b' '))
 
 
 class SomfyUIFunction(IntEnumWithStr):
@@ -133,7 +144,8 @@ class SomfyUIIndex(IntEnumWithStr):
 
 
 class SetLocalUIPayload(SomfyPayload):
-    expected_lengths = [3]
+    __slots__ = ()
+    expected_lengths = frozenset({3})
 
     def get_function(self) -> SomfyUIFunction | int:
         return enum_or_int(SomfyUIFunction, self.content[0])
@@ -146,48 +158,53 @@ class SetLocalUIPayload(SomfyPayload):
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(), "ui_index": self.get_ui_index(), "priority": self.get_priority()}
+        c = self.content
+        return {"function": enum_or_int(SomfyUIFunction, c[0]), "ui_index": enum_or_int(SomfyUIIndex, c[1]),
+                "priority": c[2]}
 
     @staticmethod
     def make(func: SomfyUIFunction | int, ui_index: SomfyUIIndex | int, priority: int) -> 'SetLocalUIPayload':
-        return SetLocalUIPayload([func, ui_index, priority])
+        return SetLocalUIPayload(bytes((func, ui_index, priority)))
 
 
 class GetLocalUIPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
     def get_ui_index(self) -> SomfyUIIndex | int:
         return enum_or_int(SomfyUIIndex, self.content[0])
 
     @override
     def as_dict(self):
-        return {"ui_index": self.get_ui_index()}
+        return {"ui_index": enum_or_int(SomfyUIIndex, self.content[0])}
 
     @staticmethod
     def make(ui_index: SomfyUIIndex | int) -> 'GetLocalUIPayload':
-        return GetLocalUIPayload([ui_index])
+        return GetLocalUIPayload(bytes((ui_index,)))
 
 
 class PostLocalUIPayload(SomfyPayload):
-    expected_lengths = [5]
+    __slots__ = ()
+    expected_lengths = frozenset({5})
 
     def get_function(self) -> SomfyUIFunction | int:
         return enum_or_int(SomfyUIFunction, self.content[0])
 
     def get_source_addr(self) -> SomfyAddress:
-        return SomfyAddress.parse_bytes(self.content[1:4])
+        return SomfyAddress.parse_bytes(self.content, 1)
 
     def get_priority(self) -> int:
         return self.content[4]
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(),
-                "source_addr": self.get_source_addr(), "priority": self.get_priority()}
+        c = self.content
+        return {"function": enum_or_int(SomfyUIFunction, c[0]),
+                "source_addr": SomfyAddress.parse_bytes(c, 1), "priority": c[4]}
 
     @staticmethod
     def make(func: SomfyUIFunction | int, source_address: SomfyAddress, priority: int) -> 'PostLocalUIPayload':
-        return PostLocalUIPayload([func] + source_address.serialize() + [priority])
+        return PostLocalUIPayload(bytes((func,)) + bytes(source_address.serialize()) + bytes((priority,)))
 
 
 class SomfyMotorIPFunction(IntEnumWithStr):
@@ -201,7 +218,10 @@ class SomfyMotorIPFunction(IntEnumWithStr):
 
 
 class SetMotorIPPayload(SomfyPayload):
-    expected_lengths = [4, 6]
+    __slots__ = ()
+    expected_lengths = frozenset({4, 6})
+    # The payload layouts by the payload length, the angle is optional
+    _LAYOUTS = {4: struct.Struct("<BBH"), 6: struct.Struct("<BBHH")}
 
     IP_POSITION_UNDEFINED = 0xFFFF
 
@@ -212,42 +232,48 @@ class SetMotorIPPayload(SomfyPayload):
         return self.content[1]
 
     def get_position(self) -> int:
-        return self.content[3] << 8 | self.content[2]
+        return _U16_LE.unpack_from(self.content, 2)[0]
 
     def get_angle(self) -> Optional[int]:
         if len(self.content) != 6:
             return None
-        return self.content[5] << 8 | self.content[4]
+        return _U16_LE.unpack_from(self.content, 4)[0]
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(), "ip_index": self.get_ip_index(), "position": self.get_position(),
-                "angle": self.get_angle()}
+        func, ip_index, position, *angle = self._LAYOUTS[len(self.content)].unpack(self.content)
+        return {"function": enum_or_int(SomfyMotorIPFunction, func), "ip_index": ip_index, "position": position,
+                "angle": angle[0] if angle else None}
 
     @staticmethod
     def make(func: SomfyMotorIPFunction | int, ip_index: int, position: int,
              angle: Optional[int]) -> 'SetMotorIPPayload':
-        angle_list = [angle >> 8 & 0xFF, angle & 0xFF] if angle else []
-        return SetMotorIPPayload([func, ip_index, position >> 8 & 0xFF, position & 0xFF] + angle_list)
+        if angle is None:
+            return SetMotorIPPayload(SetMotorIPPayload._LAYOUTS[4].pack(func, ip_index, position & 0xFFFF))
+        return SetMotorIPPayload(SetMotorIPPayload._LAYOUTS[6].pack(func, ip_index, position & 0xFFFF, angle & 0xFFFF))
 
 
 class GetMotorIPPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
     def get_ip_index(self):
         return self.content[0]
 
     @override
     def as_dict(self):
-        return {"ip_index": self.get_ip_index()}
+        return {"ip_index": self.content[0]}
 
     @staticmethod
     def make(ip_index: int) -> 'GetMotorIPPayload':
-        return GetMotorIPPayload([ip_index])
+        return GetMotorIPPayload(bytes((ip_index,)))
 
 
 class PostMotorIPPayload(SomfyPayload):
-    expected_lengths = [4, 9]
+    __slots__ = ()
+    expected_lengths = frozenset({4, 9})
+    # The payload layouts by the payload length, the angle is optional
+    _LAYOUTS = {4: struct.Struct("<BxBx"), 9: struct.Struct("<BxBxxxxH")}
 
     UNSET_POSITION = 0xFF
     UNSET_ANGLE = 0x8000
@@ -261,21 +287,23 @@ class PostMotorIPPayload(SomfyPayload):
     def get_angle(self) -> Optional[int]:
         if len(self.content) != 9:
             return None
-        angle = self.content[8] << 8 | self.content[7]
-        return angle
+        return _U16_LE.unpack_from(self.content, 7)[0]
 
     @override
     def as_dict(self):
-        return {"ip_index": self.get_ip_index(), "position": self.get_position(), "angle": self.get_angle()}
+        ip_index, position, *angle = self._LAYOUTS[len(self.content)].unpack(self.content)
+        return {"ip_index": ip_index, "position": position, "angle": angle[0] if angle else None}
 
     @staticmethod
     def make(ip_index: int, position: int, angle: Optional[int]) -> 'PostMotorIPPayload':
-        angle_list = [0, 0, 0, angle & 0xFF, angle >> 8 & 0xFF] if angle else []
-        return PostMotorIPPayload([ip_index, 0, 0, position] + angle_list)
+        if angle is None:
+            return PostMotorIPPayload(PostMotorIPPayload._LAYOUTS[4].pack(ip_index, position))
+        return PostMotorIPPayload(PostMotorIPPayload._LAYOUTS[9].pack(ip_index, position, angle & 0xFFFF))
 
 
 class MotorSpeedPayload(SomfyPayload):
-    expected_lengths = [3]
+    __slots__ = ()
+    expected_lengths = frozenset({3})
 
     def get_up_speed_rpm(self) -> int:
         return self.content[0]
@@ -288,12 +316,12 @@ class MotorSpeedPayload(SomfyPayload):
 
     @override
     def as_dict(self):
-        return {"up_speed_rpm": self.get_up_speed_rpm(), "down_speed_rpm": self.get_down_speed_rpm(),
-                "slow_speed_rpm": self.get_slow_speed_rpm()}
+        c = self.content
+        return {"up_speed_rpm": c[0], "down_speed_rpm": c[1], "slow_speed_rpm": c[2]}
 
     @staticmethod
     def make(up_speed_rpm: int, down_speed_rpm: int, slow_speed_rpm: int) -> 'MotorSpeedPayload':
-        return MotorSpeedPayload([up_speed_rpm, down_speed_rpm, slow_speed_rpm])
+        return MotorSpeedPayload(bytes((up_speed_rpm, down_speed_rpm, slow_speed_rpm)))
 
 
 class LockNetworkFunction(IntEnumWithStr):
@@ -304,7 +332,8 @@ class LockNetworkFunction(IntEnumWithStr):
 
 
 class SetNetworkLockPayload(SomfyPayload):
-    expected_lengths = [2]
+    __slots__ = ()
+    expected_lengths = frozenset({2})
 
     def get_function(self) -> LockNetworkFunction | int:
         return enum_or_int(LockNetworkFunction, self.content[0])
@@ -314,21 +343,22 @@ class SetNetworkLockPayload(SomfyPayload):
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(), "priority": self.get_priority()}
+        return {"function": enum_or_int(LockNetworkFunction, self.content[0]), "priority": self.content[1]}
 
     @staticmethod
     def make(func: LockNetworkFunction | int, priority: int) -> 'SetNetworkLockPayload':
-        return SetNetworkLockPayload([func, priority])
+        return SetNetworkLockPayload(bytes((func, priority)))
 
 
 class PostNetworkLockPayload(SomfyPayload):
-    expected_lengths = [6]
+    __slots__ = ()
+    expected_lengths = frozenset({6})
 
     def is_locked(self) -> bool:
         return self.content[0] != 0
 
     def get_lock_holder(self) -> SomfyAddress:
-        return SomfyAddress.parse_bytes(self.content[1:4])
+        return SomfyAddress.parse_bytes(self.content, 1)
 
     def get_priority(self) -> int:
         return self.content[4]
@@ -338,14 +368,15 @@ class PostNetworkLockPayload(SomfyPayload):
 
     @override
     def as_dict(self):
-        return {"is_locked": self.is_locked(), "lock_holder": self.get_lock_holder(), "priority": self.get_priority(),
-                "is_persistent_across_power_cycle": self.is_persistent_across_power_cycle()}
+        c = self.content
+        return {"is_locked": c[0] != 0, "lock_holder": SomfyAddress.parse_bytes(c, 1), "priority": c[4],
+                "is_persistent_across_power_cycle": c[5] != 0}
 
     @staticmethod
     def make(locked: bool, lock_holder: SomfyAddress, priority: int,
              persistent_across_power_cycle: bool) -> 'PostNetworkLockPayload':
-        return PostNetworkLockPayload([int(locked), lock_holder.serialize(), priority,
-                                       int(persistent_across_power_cycle)])
+        return PostNetworkLockPayload(bytes((int(locked),)) + bytes(lock_holder.serialize()) +
+                                      bytes((priority, int(persistent_across_power_cycle))))
 
 
 class CtrlMoveToFunction(IntEnumWithStr):
@@ -360,51 +391,62 @@ class CtrlMoveToFunction(IntEnumWithStr):
 
 
 class CtrlMoveToPayload(SomfyPayload):
-    expected_lengths = [4, 6]
+    __slots__ = ()
+    expected_lengths = frozenset({4, 6})
+    # The payload layouts by the payload length, the angle is optional
+    _LAYOUTS = {4: struct.Struct("<BHx"), 6: struct.Struct("<BHxH")}
 
     def get_function(self) -> CtrlMoveToFunction | int:
         return enum_or_int(CtrlMoveToFunction, self.content[0])
 
     def get_position(self) -> int:
-        return self.content[2] << 8 | self.content[1]
+        return _U16_LE.unpack_from(self.content, 1)[0]
 
     def get_angle(self) -> Optional[int]:
         if len(self.content) != 6:
             return None
-        return self.content[5] << 8 | self.content[4]
+        return _U16_LE.unpack_from(self.content, 4)[0]
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(), "position": self.get_position(), "angle": self.get_angle()}
+        func, position, *angle = self._LAYOUTS[len(self.content)].unpack(self.content)
+        return {"function": enum_or_int(CtrlMoveToFunction, func), "position": position,
+                "angle": angle[0] if angle else None}
 
     @staticmethod
     def make(func: CtrlMoveToFunction | int, position: int, angle: Optional[int] = None) -> 'CtrlMoveToPayload':
-        angle_list = [angle & 0xFF, angle >> 8 & 0xFF] if angle else []
-        return CtrlMoveToPayload([func, position & 0xFF, position >> 8 & 0xFF, 0] + angle_list)
+        if angle is None:
+            return CtrlMoveToPayload(CtrlMoveToPayload._LAYOUTS[4].pack(func, position & 0xFFFF))
+        return CtrlMoveToPayload(CtrlMoveToPayload._LAYOUTS[6].pack(func, position & 0xFFFF, angle & 0xFFFF))
 
 
 class CtrlStopPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
+    # The reserved field is always 0, it's not included into as_dict
     def get_reserved(self) -> int:
         return self.content[0]
 
     @override
     def as_dict(self):
-        return {"reserved": self.get_reserved()}
+        return {}
 
     @staticmethod
     def make(reserved: int = 0) -> 'CtrlStopPayload':
-        return CtrlStopPayload([reserved])
+        return CtrlStopPayload(bytes((reserved,)))
 
 
 class PostMotorPositionPayload(SomfyPayload):
-    expected_lengths = [5, 11]
+    __slots__ = ()
+    expected_lengths = frozenset({5, 11})
+    # The payload layouts by the payload length, the tilt angle is optional
+    _LAYOUTS = {5: struct.Struct("<HBBB"), 11: struct.Struct("<HBBBxxHxx")}
 
     IP_UNDEFINED = 0xFF
 
     def get_position_pulses(self) -> int:
-        return self.content[1] << 8 | self.content[0]
+        return _U16_LE.unpack_from(self.content, 0)[0]
 
     def get_position_percent(self) -> int:
         return self.content[2]
@@ -421,19 +463,22 @@ class PostMotorPositionPayload(SomfyPayload):
     def get_tilt_degrees(self) -> Optional[int]:
         if len(self.content) != 11:
             return None
-        return self.content[8] << 8 | self.content[7]
+        return _U16_LE.unpack_from(self.content, 7)[0]
 
     @override
     def as_dict(self):
-        return {"position_pulses": self.get_position_pulses(), "position_percent": self.get_position_percent(),
-                "tilt_percent": self.get_tilt_percent(), "ip": self.get_ip(), "tilt_degrees": self.get_tilt_degrees()}
+        pulses, percent, tilt_percent, ip, *tilt_degrees = self._LAYOUTS[len(self.content)].unpack(self.content)
+        return {"position_pulses": pulses, "position_percent": percent, "tilt_percent": tilt_percent,
+                "ip": None if ip == self.IP_UNDEFINED else ip,
+                "tilt_degrees": tilt_degrees[0] if tilt_degrees else None}
 
     @staticmethod
     def make(position_pulses: int, position_percent: int, tilt_percent: int,
              ip: int, tilt_degrees: Optional[int]) -> 'PostMotorPositionPayload':
-        angle_list = [0, 0, tilt_degrees & 0xFF, tilt_degrees >> 8 & 0xFF, 0, 0] if tilt_degrees else []
-        return PostMotorPositionPayload(
-            [position_pulses & 0xFF, position_pulses >> 8 & 0xFF, position_percent, tilt_percent, ip] + angle_list)
+        fields = (position_pulses & 0xFFFF, position_percent, tilt_percent, ip)
+        if tilt_degrees is None:
+            return PostMotorPositionPayload(PostMotorPositionPayload._LAYOUTS[5].pack(*fields))
+        return PostMotorPositionPayload(PostMotorPositionPayload._LAYOUTS[11].pack(*fields, tilt_degrees & 0xFFFF))
 
 
 class MotorStatus(IntEnumWithStr):
@@ -468,29 +513,39 @@ class MotorStatusCause(IntEnumWithStr):
 
 
 class PostMotorStatusPayload(SomfyPayload):
-    expected_lengths = [4]
+    __slots__ = ('_status', '_direction', '_command_source', '_status_cause')
+    expected_lengths = frozenset({4})
+
+    # The status is typically polled and then inspected several times, so the fields are decoded only once
+    def __init__(self, content: bytes | List[int]):
+        super().__init__(content)
+        c = self.content
+        self._status = enum_or_int(MotorStatus, c[0])
+        self._direction = enum_or_int(MotorDirection, c[1])
+        self._command_source = enum_or_int(MotorCommandSource, c[2])
+        self._status_cause = enum_or_int(MotorStatusCause, c[3])
 
     def get_status(self) -> MotorStatus | int:
-        return enum_or_int(MotorStatus, self.content[0])
+        return self._status
 
     def get_direction(self) -> MotorDirection | int:
-        return enum_or_int(MotorDirection, self.content[1])
+        return self._direction
 
     def get_command_source(self) -> MotorCommandSource | int:
-        return enum_or_int(MotorCommandSource, self.content[2])
+        return self._command_source
 
     def get_status_cause(self) -> MotorStatusCause | int:
-        return enum_or_int(MotorStatusCause, self.content[3])
+        return self._status_cause
 
     @override
     def as_dict(self):
-        return {"status": self.get_status(), "direction": self.get_direction(),
-                "command_source": self.get_command_source(), "status_cause": self.get_status_cause()}
+        return {"status": self._status, "direction": self._direction,
+                "command_source": self._command_source, "status_cause": self._status_cause}
 
     @staticmethod
     def make(status: MotorStatus | int, direction: MotorDirection | int, source: MotorCommandSource | int,
              cause: MotorStatusCause | int) -> 'PostMotorStatusPayload':
-        return PostMotorStatusPayload([status, direction, source, cause])
+        return PostMotorStatusPayload(bytes((status, direction, source, cause)))
 
 
 #############################################################################################
@@ -503,21 +558,25 @@ class SomfyDirection(IntEnumWithStr):
 
 
 class CtrlMoveForcedPayload(SomfyPayload):
-    expected_lengths = [3]
+    __slots__ = ()
+    expected_lengths = frozenset({3})
+    # The payload layout: direction, tens_of_ms
+    _LAYOUT = struct.Struct("<BH")
 
     def get_direction(self) -> SomfyDirection | int:
         return enum_or_int(SomfyDirection, self.content[0])
 
     # The movement duration in the units of 10ms
     def get_tens_of_ms(self) -> int:
-        return self.content[2] << 8 | self.content[1]
+        return _U16_LE.unpack_from(self.content, 1)[0]
 
     def as_dict(self):
-        return {"direction": self.get_direction(), "tens_of_ms": self.get_tens_of_ms()}
+        direction, tens_of_ms = self._LAYOUT.unpack(self.content)
+        return {"direction": enum_or_int(SomfyDirection, direction), "tens_of_ms": tens_of_ms}
 
     @staticmethod
     def make(direction: SomfyDirection, tens_of_ms: int) -> 'CtrlMoveForcedPayload':
-        return CtrlMoveForcedPayload([direction, tens_of_ms & 0xFF, tens_of_ms >> 8 & 0xFF])
+        return CtrlMoveForcedPayload(CtrlMoveForcedPayload._LAYOUT.pack(direction, tens_of_ms & 0xFFFF))
 
 
 class RelativeMoveFunction(IntEnumWithStr):
@@ -530,20 +589,24 @@ class RelativeMoveFunction(IntEnumWithStr):
 
 
 class CtrlMoveRelativePayload(SomfyPayload):
-    expected_lengths = [4]
+    __slots__ = ()
+    expected_lengths = frozenset({4})
+    # The payload layout: function, parameter, padding
+    _LAYOUT = struct.Struct("<BHx")
 
     def get_function(self) -> RelativeMoveFunction | int:
         return enum_or_int(RelativeMoveFunction, self.content[0])
 
     def get_parameter(self) -> int:
-        return self.content[2] >> 8 | self.content[1]
+        return _U16_LE.unpack_from(self.content, 1)[0]
 
     def as_dict(self):
-        return {"function": self.get_function(), "parameter": self.get_parameter()}
+        func, parameter = self._LAYOUT.unpack(self.content)
+        return {"function": enum_or_int(RelativeMoveFunction, func), "parameter": parameter}
 
     @staticmethod
     def make(func: RelativeMoveFunction | int, parameter: int) -> 'CtrlMoveRelativePayload':
-        return CtrlMoveRelativePayload([func, parameter & 0xFF, parameter >> 8 & 0xFF, 0])
+        return CtrlMoveRelativePayload(CtrlMoveRelativePayload._LAYOUT.pack(func, parameter & 0xFFFF))
 
 
 class SetLimitsFunction(IntEnumWithStr):
@@ -554,7 +617,10 @@ class SetLimitsFunction(IntEnumWithStr):
 
 
 class SetMotorLimitsPayload(SomfyPayload):
-    expected_lengths = [4]
+    __slots__ = ()
+    expected_lengths = frozenset({4})
+    # The payload layout: function, direction, parameter
+    _LAYOUT = struct.Struct("<BBH")
 
     def get_function(self) -> SetLimitsFunction | int:
         return enum_or_int(SetLimitsFunction, self.content[0])
@@ -563,33 +629,39 @@ class SetMotorLimitsPayload(SomfyPayload):
         return enum_or_int(SomfyDirection, self.content[1])
 
     def get_parameter(self) -> int:
-        return self.content[3] << 8 | self.content[2]
+        return _U16_LE.unpack_from(self.content, 2)[0]
 
     @override
     def as_dict(self):
-        return {"function": self.get_function(), "direction": self.get_direction(), "parameter": self.get_parameter()}
+        func, direction, parameter = self._LAYOUT.unpack(self.content)
+        return {"function": enum_or_int(SetLimitsFunction, func), "direction": enum_or_int(SomfyDirection, direction),
+                "parameter": parameter}
 
     @staticmethod
     def make(func: SetLimitsFunction, direction: SomfyDirection, param: int) -> 'SetMotorLimitsPayload':
-        return SetMotorLimitsPayload([func, direction, param & 0xFF, param >> 8 & 0xFF])
+        return SetMotorLimitsPayload(SetMotorLimitsPayload._LAYOUT.pack(func, direction, param & 0xFFFF))
 
 
 class PostMotorLimitsPayload(SomfyPayload):
-    expected_lengths = [4]
+    __slots__ = ()
+    expected_lengths = frozenset({4})
+    # The payload layout: reserved, limit
+    _LAYOUT = struct.Struct("<HH")
 
+    # The reserved field is always 0, it's not included into as_dict
     def get_reserved(self) -> int:
-        return self.content[1] << 8 | self.content[0] & 0xFF
+        return _U16_LE.unpack_from(self.content, 0)[0]
 
     def get_limit(self) -> int:
-        return self.content[3] << 8 | self.content[2] & 0xFF
+        return _U16_LE.unpack_from(self.content, 2)[0]
 
     @override
     def as_dict(self):
-        return {"reserved": self.get_reserved(), "limit": self.get_limit()}
+        return {"limit": _U16_LE.unpack_from(self.content, 2)[0]}
 
     @staticmethod
     def make(limit: int) -> 'PostMotorLimitsPayload':
-        return PostMotorLimitsPayload([0, 0, limit & 0xFF, limit >> 8 & 0xFF])
+        return PostMotorLimitsPayload(PostMotorLimitsPayload._LAYOUT.pack(0, limit & 0xFFFF))
 
 
 class MotorRotationDirection(IntEnumWithStr):
@@ -598,60 +670,63 @@ class MotorRotationDirection(IntEnumWithStr):
 
 
 class MotorRotationDirectionPayload(SomfyPayload):
-    expected_lengths = [1]
+    __slots__ = ()
+    expected_lengths = frozenset({1})
 
     def get_direction(self) -> MotorRotationDirection | int:
         return enum_or_int(MotorRotationDirection, self.content[0])
 
     def as_dict(self):
-        return {"direction": self.get_direction()}
+        return {"direction": enum_or_int(MotorRotationDirection, self.content[0])}
 
     @staticmethod
     def make(direction: MotorRotationDirection | int) -> 'MotorRotationDirectionPayload':
-        return MotorRotationDirectionPayload([direction])
+        return MotorRotationDirectionPayload(bytes((direction,)))
+
+
+# The payload wrappers for the messages, built once at the import time
+_DOCUMENTED_PAYLOADS = dict[int, type]({
+    SomfyMessageId.GET_NODE_ADDR: EmptyPayload,
+    SomfyMessageId.POST_NODE_ADDR: EmptyPayload,
+    SomfyMessageId.SET_GROUP_ADDR: GroupAddrPayload,
+    SomfyMessageId.GET_GROUP_ADDR: GroupIndexPayload,
+    SomfyMessageId.POST_GROUP_ADDR: GroupAddrPayload,
+    SomfyMessageId.ACK: EmptyPayload,
+    SomfyMessageId.NACK: NackPayload,
+    SomfyMessageId.GET_NODE_APP_VERSION: EmptyPayload,
+    SomfyMessageId.POST_NODE_APP_VERSION: NodeAppVersionPayload,
+    SomfyMessageId.SET_NODE_LABEL: NodeLabelPayload,
+    SomfyMessageId.GET_NODE_LABEL: EmptyPayload,
+    SomfyMessageId.POST_NODE_LABEL: NodeLabelPayload,
+    SomfyMessageId.SET_LOCAL_UI: SetLocalUIPayload,
+    SomfyMessageId.GET_LOCAL_UI: GetLocalUIPayload,
+    SomfyMessageId.POST_LOCAL_UI: PostLocalUIPayload,
+    SomfyMessageId.SET_MOTOR_IP: SetMotorIPPayload,
+    SomfyMessageId.GET_MOTOR_IP: GetMotorIPPayload,
+    SomfyMessageId.POST_MOTOR_IP: PostMotorIPPayload,
+    SomfyMessageId.SET_MOTOR_ROLLING_SPEED: MotorSpeedPayload,
+    SomfyMessageId.GET_MOTOR_ROLLING_SPEED: EmptyPayload,
+    SomfyMessageId.POST_MOTOR_ROLLING_SPEED: MotorSpeedPayload,
+    SomfyMessageId.SET_NETWORK_LOCK: SetNetworkLockPayload,
+    SomfyMessageId.GET_NETWORK_LOCK: EmptyPayload,
+    SomfyMessageId.POST_NETWORK_LOCK: PostNetworkLockPayload,
+    SomfyMessageId.CTRL_MOVETO: CtrlMoveToPayload,
+    SomfyMessageId.CTRL_STOP: CtrlStopPayload,
+    SomfyMessageId.GET_MOTOR_POSITION: EmptyPayload,
+    SomfyMessageId.POST_MOTOR_POSITION: PostMotorPositionPayload,
+    SomfyMessageId.GET_MOTOR_STATUS: EmptyPayload,
+    SomfyMessageId.POST_MOTOR_STATUS: PostMotorStatusPayload,
+    # Reversed payloads:
+    SomfyMessageId.CTRL_MOVE_FORCED: CtrlMoveForcedPayload,
+    SomfyMessageId.CTRL_MOVE_RELATIVE: CtrlMoveRelativePayload,
+    SomfyMessageId.SET_MOTOR_LIMITS: SetMotorLimitsPayload,
+    SomfyMessageId.GET_MOTOR_LIMITS: EmptyPayload,
+    SomfyMessageId.POST_MOTOR_LIMITS: PostMotorLimitsPayload,
+    SomfyMessageId.SET_MOTOR_ROTATION_DIRECTION: MotorRotationDirectionPayload,
+    SomfyMessageId.GET_MOTOR_ROTATION_DIRECTION: EmptyPayload,
+    SomfyMessageId.POST_MOTOR_ROTATION_DIRECTION: MotorRotationDirectionPayload,
+})
 
 
 def register_documented_payloads():
-    dp = dict[int, type]({
-        SomfyMessageId.GET_NODE_ADDR: EmptyPayload,
-        SomfyMessageId.POST_NODE_ADDR: EmptyPayload,
-        SomfyMessageId.SET_GROUP_ADDR: GroupAddrPayload,
-        SomfyMessageId.GET_GROUP_ADDR: GroupIndexPayload,
-        SomfyMessageId.POST_GROUP_ADDR: GroupAddrPayload,
-        SomfyMessageId.ACK: EmptyPayload,
-        SomfyMessageId.NACK: NackPayload,
-        SomfyMessageId.GET_NODE_APP_VERSION: EmptyPayload,
-        SomfyMessageId.POST_NODE_APP_VERSION: NodeAppVersionPayload,
-        SomfyMessageId.SET_NODE_LABEL: NodeLabelPayload,
-        SomfyMessageId.GET_NODE_LABEL: EmptyPayload,
-        SomfyMessageId.POST_NODE_LABEL: NodeLabelPayload,
-        SomfyMessageId.SET_LOCAL_UI: SetLocalUIPayload,
-        SomfyMessageId.GET_LOCAL_UI: GetLocalUIPayload,
-        SomfyMessageId.POST_LOCAL_UI: PostLocalUIPayload,
-        SomfyMessageId.SET_MOTOR_IP: SetMotorIPPayload,
-        SomfyMessageId.GET_MOTOR_IP: GetMotorIPPayload,
-        SomfyMessageId.POST_MOTOR_IP: PostMotorIPPayload,
-        SomfyMessageId.SET_MOTOR_ROLLING_SPEED: MotorSpeedPayload,
-        SomfyMessageId.GET_MOTOR_ROLLING_SPEED: EmptyPayload,
-        SomfyMessageId.POST_MOTOR_ROLLING_SPEED: MotorSpeedPayload,
-        SomfyMessageId.SET_NETWORK_LOCK: SetNetworkLockPayload,
-        SomfyMessageId.GET_NETWORK_LOCK: EmptyPayload,
-        SomfyMessageId.POST_NETWORK_LOCK: PostNetworkLockPayload,
-        SomfyMessageId.CTRL_MOVETO: CtrlMoveToPayload,
-        SomfyMessageId.CTRL_STOP: CtrlStopPayload,
-        SomfyMessageId.GET_MOTOR_POSITION: EmptyPayload,
-        SomfyMessageId.POST_MOTOR_POSITION: PostMotorPositionPayload,
-        SomfyMessageId.GET_MOTOR_STATUS: EmptyPayload,
-        SomfyMessageId.POST_MOTOR_STATUS: PostMotorStatusPayload,
-        # Reversed payloads:
-        SomfyMessageId.CTRL_MOVE_FORCED: CtrlMoveForcedPayload,
-        SomfyMessageId.CTRL_MOVE_RELATIVE: CtrlMoveRelativePayload,
-        SomfyMessageId.SET_MOTOR_LIMITS: SetMotorLimitsPayload,
-        SomfyMessageId.GET_MOTOR_LIMITS: EmptyPayload,
-        SomfyMessageId.POST_MOTOR_LIMITS: PostMotorLimitsPayload,
-        SomfyMessageId.SET_MOTOR_ROTATION_DIRECTION: MotorRotationDirectionPayload,
-        SomfyMessageId.GET_MOTOR_ROTATION_DIRECTION: EmptyPayload,
-        SomfyMessageId.POST_MOTOR_ROTATION_DIRECTION: MotorRotationDirectionPayload,
-    })
-
-    register_message_payloads(dp)
+    register_message_payloads(_DOCUMENTED_PAYLOADS)
@@ -1,4 +1,5 @@
-from typing import Optional
+import re
+from typing import Optional, List, Tuple
 
 from somfy.messages import SomfyMessage, NodeType
 
@@ -6,39 +7,61 @@ from somfy.messages import SomfyMessage, NodeType
 MIN_MESSAGE_LENGTH = 11
 MAX_MESSAGE_LEN = 32
 
+# The checksum can't be larger than MAX_MESSAGE_LEN * 256, so its high byte must be below MAX_MESSAGE_LEN. Only the
+# bytes that follow such a byte can end a message, and the regex engine can find them without a Python-level loop.
+CHECKSUM_HIGH_BYTE_RE = re.compile(b'[\x00-%c]' % (MAX_MESSAGE_LEN - 1))
+
+_EMPTY_RING = bytes(MAX_MESSAGE_LEN)
+# MAX_MESSAGE_LEN is a power of two, so the ring positions wrap around with a mask
+_RING_MASK = MAX_MESSAGE_LEN - 1
+
 
 # SDN runs over an RS-485 network, which is a noisy bus. We might periodically get random noise and/or third-party
 # traffic. So we need to make sure we can recognize messages with some random padding before (and after) them.
 # This class implements a simple ring buffer for the incoming data.
 class MessageRecognizer(object):
     def __init__(self, node_type_filter: Optional[NodeType] = None):
-        self.ring = list[int]([0] * MAX_MESSAGE_LEN)
+        self.ring = bytearray(MAX_MESSAGE_LEN)
         self.node_type_filter = node_type_filter
         self.pos = 0
 
+    # Forget the received data, so that the recognizer can be reused for another exchange
+    def reset(self):
+        self.ring[:] = _EMPTY_RING
+        self.pos = 0
+
     def ring_at(self, i) -> int:
-        return self.ring[i % MAX_MESSAGE_LEN] & 0xFF
+        return self.ring[i & _RING_MASK]
 
     # Add a byte to the buffer, and try to detect a message. Returns the detected message if successful.
+    # This is called for every byte on the bus, so the ring is accessed directly instead of using `ring_at`.
     def add_data(self, cur_byte: int) -> Optional[SomfyMessage]:
-        prev_byte = self.ring_at(self.pos - 1)
-        self.ring[self.pos] = cur_byte
+        ring = self.ring
+        pos = self.pos
+        prev_byte = ring[pos - 1]  # Negative indices wrap around to the end of the ring
+        cur_byte &= 0xFF
+        ring[pos] = cur_byte
         possible_checksum = prev_byte * 256 + cur_byte
-        self.pos = (self.pos + 1) % MAX_MESSAGE_LEN
+        pos = (pos + 1) & _RING_MASK
+        self.pos = pos
 
         # There's no way the checksum can be that large (or small)
         if possible_checksum >= MAX_MESSAGE_LEN * 256 or possible_checksum == 0:
             return None
 
         # Try to see if the previous bytes in the ring form a valid message
-        probable_message_start_pos = (self.pos - 3) % 32
+        probable_message_start_pos = (pos - 3) & _RING_MASK
         remaining_sum = possible_checksum
         count = 3
         # Walk backwards through the ring to try and find a position from which the bytes would sum up to yield
         # the supposed checksum.
-        while probable_message_start_pos != self.pos:
-            remaining_sum -= self.ring_at(probable_message_start_pos)
-            if remaining_sum == 0:
+        while probable_message_start_pos != pos:
+            remaining_sum -= ring[probable_message_start_pos]
+            if remaining_sum <= 0:
+                # The bytes are non-negative, so the sum can't get back to zero once it goes below it
+                if remaining_sum < 0:
+                    return None
+
                 # 11 bytes is the smallest message:
                 # [msg_id, len, direction] + [3 bytes from addr] + [3 bytes to addr] + [2 bytes checksum]
                 if count < MIN_MESSAGE_LENGTH:
@@ -53,21 +76,68 @@ class MessageRecognizer(object):
                     self.blank_out(probable_message_start_pos, count)
                     if self.node_type_filter is None or self.node_type_filter == msg.from_node_type:
                         return msg
+                    return None
                 else:
                     # The further search is futile, return and wait for the next message
                     return None
 
             # Try to extend the probable message to the left
-            probable_message_start_pos = (probable_message_start_pos - 1) % MAX_MESSAGE_LEN
+            probable_message_start_pos = (probable_message_start_pos - 1) & _RING_MASK
             count += 1
         return None
 
-    def copy(self, from_pos, count):
+    # Add a chunk of data, and detect the messages in it. This is equivalent to calling `add_data` for each byte, but
+    # the backward walk is only attempted at the positions where a message can possibly end.
+    # Returns the detected messages, along with the offsets in `data` right after their last byte.
+    def add_bytes(self, data: bytes) -> List[Tuple[SomfyMessage, int]]:
         res = []
-        for i in range(from_pos, from_pos + count):
-            res.append(self.ring_at(i))
+        try_parse = SomfyMessage.try_parse
+        node_type_filter = self.node_type_filter
+        # Lay out the ring history and the new data in a single linear buffer
+        history_len = MAX_MESSAGE_LEN
+        buf = self.ring[self.pos:] + self.ring[:self.pos]
+        buf += data
+        for match in CHECKSUM_HIGH_BYTE_RE.finditer(buf, history_len - 1, len(buf) - 1):
+            end = match.start() + 1  # The position of the low checksum byte
+            # The earlier messages might have blanked out the checksum, so recheck it
+            possible_checksum = buf[end - 1] * 256 + buf[end]
+            if possible_checksum >= MAX_MESSAGE_LEN * 256 or possible_checksum == 0:
+                continue
+
+            # Walk backwards, exactly like add_data does within the ring
+            remaining_sum = possible_checksum
+            count = 3
+            for start in range(end - 2, end - MAX_MESSAGE_LEN + 1, -1):
+                remaining_sum -= buf[start]
+                if remaining_sum > 0:
+                    count += 1
+                    continue
+                # The (inverted) length byte must agree with the candidate's length, this rejects most of the
+                # false candidates without parsing them
+                if remaining_sum == 0 and count >= MIN_MESSAGE_LENGTH and ~buf[start + 1] & 0x7F == count:
+                    msg = try_parse(buf[start:end + 1])
+                    if msg is not None:
+                        buf[start:end + 1] = b'\xFF' * count
+                        if node_type_filter is None or node_type_filter == msg.from_node_type:
+                            res.append((msg, end + 1 - history_len))
+                break
+
+        # The tail of the buffer becomes the new ring
+        self.ring = buf[-MAX_MESSAGE_LEN:]
+        self.pos = 0
         return res
 
+    # The data can wrap around the end of the ring, so it's copied (or blanked out) with up to two slices
+    def copy(self, from_pos, count) -> bytes:
+        end = from_pos + count
+        if end <= MAX_MESSAGE_LEN:
+            return bytes(self.ring[from_pos:end])
+        return bytes(self.ring[from_pos:] + self.ring[:end - MAX_MESSAGE_LEN])
+
     def blank_out(self, from_pos, count):
-        for i in range(from_pos, from_pos + count):
-            self.ring[i % MAX_MESSAGE_LEN] = 0xFF
+        end = from_pos + count
+        if end <= MAX_MESSAGE_LEN:
+            self.ring[from_pos:end] = b'\xFF' * count
+        else:
+            self.ring[from_pos:] = b'\xFF' * (MAX_MESSAGE_LEN - from_pos)
+            self.ring[:end - MAX_MESSAGE_LEN] = b'\xFF' * (end - MAX_MESSAGE_LEN)
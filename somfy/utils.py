@@ -1,11 +1,19 @@
 import asyncio
 import typing
-from asyncio import get_event_loop
+from asyncio import get_running_loop
 
-from somfy.connector import SomfyExchanger, try_to_exchange_one
-from somfy.messages import SomfyMessage, SomfyMessageId, SomfyAddress
+from somfy.connector import SomfyExchanger, try_to_exchange
+from somfy.messages import SomfyMessage, SomfyMessageId, SomfyAddress, NodeType, MASTER_ADDRESS
 from somfy.payloads import NackPayload, PostMotorPositionPayload
 
+# How often the motor position is polled while waiting for the movement to complete. The interval grows while the
+# position stays the same, up to the maximum.
+POSITION_POLL_INTERVAL_SEC = 0.5
+POSITION_POLL_MAX_INTERVAL_SEC = 2.0
+POSITION_POLL_BACKOFF = 1.5
+# The movement is considered complete once the position stays the same for this long
+POSITION_SETTLE_TIME_SEC = 1.5
+
 
 class SomfyException(Exception):
     pass
@@ -24,7 +32,8 @@ async def send_with_ack(addr, connector: SomfyExchanger, to_sent: SomfyMessage):
     ack_or_nack: typing.Optional[SomfyMessage] = None
 
     def filter_type(msg: SomfyMessage):
-        if msg.from_addr == addr and msg.msgid in [SomfyMessageId.ACK, SomfyMessageId.NACK]:
+        msgid = msg.msgid
+        if (msgid == SomfyMessageId.ACK or msgid == SomfyMessageId.NACK) and msg.from_addr == addr:
             nonlocal ack_or_nack
             ack_or_nack = msg
             return False
@@ -44,20 +53,54 @@ async def send_with_ack(addr, connector: SomfyExchanger, to_sent: SomfyMessage):
 
 async def wait_for_completion(addr: SomfyAddress, connector: SomfyExchanger,
                               progres_callback: typing.Callable[[PostMotorPositionPayload], None]):
-    loop = get_event_loop()
+    loop = get_running_loop()
     last_change_time = loop.time()
     last_pulses = 0
-    # Keep polling while the shades are moving
-    while loop.time() - last_change_time <= 1.5:
-        reply = await try_to_exchange_one(connector, addr, SomfyMessageId.GET_MOTOR_POSITION,
-                                          SomfyMessageId.POST_MOTOR_POSITION)
-        if reply:
-            pos = typing.cast(PostMotorPositionPayload, reply.payload)
-            if pos.get_position_pulses() != last_pulses:
-                last_pulses = pos.get_position_pulses()
-                last_change_time = loop.time()
-            if progres_callback:
-                progres_callback(pos)
-
-        await asyncio.sleep(0.5)
+    poll_interval = POSITION_POLL_INTERVAL_SEC
+    get_position = SomfyMessage(msgid=SomfyMessageId.GET_MOTOR_POSITION,
+                                from_node_type=NodeType.TYPE_ALL, from_addr=MASTER_ADDRESS,
+                                to_node_type=NodeType.TYPE_ALL, to_addr=addr)
+
+    # Some motors report their position on their own while moving, such reports replace the polls
+    reported: typing.Optional[SomfyMessage] = None
+    position_reported = asyncio.Event()
+
+    def watch_position(msg: SomfyMessage):
+        if msg.msgid == SomfyMessageId.POST_MOTOR_POSITION and msg.from_addr == addr:
+            nonlocal reported
+            reported = msg
+            position_reported.set()
+
+    connector.add_listener(watch_position)
+    try:
+        # Keep polling while the shades are moving. The polling interval is counted from the start of the exchange,
+        # so the exchange latency doesn't stretch it.
+        while loop.time() - last_change_time < POSITION_SETTLE_TIME_SEC:
+            poll_time = loop.time()
+            if reported is not None:
+                reply, reported = reported, None
+                position_reported.clear()
+            else:
+                reply = await try_to_exchange(connector, get_position, SomfyMessageId.POST_MOTOR_POSITION)
+            if reply:
+                pos = typing.cast(PostMotorPositionPayload, reply.payload)
+                if pos.get_position_pulses() != last_pulses:
+                    last_pulses = pos.get_position_pulses()
+                    last_change_time = loop.time()
+                    poll_interval = POSITION_POLL_INTERVAL_SEC
+                else:
+                    # The motor is not moving (yet or anymore), don't load the bus with the polls
+                    poll_interval = min(poll_interval * POSITION_POLL_BACKOFF, POSITION_POLL_MAX_INTERVAL_SEC)
+                if progres_callback:
+                    progres_callback(pos)
 
+            # Wait for the next poll, or for the motor to report its position. The backoff must not delay noticing
+            # that the movement is complete.
+            try:
+                async with asyncio.timeout_at(min(poll_time + poll_interval,
+                                                  last_change_time + POSITION_SETTLE_TIME_SEC)):
+                    await position_reported.wait()
+            except TimeoutError:
+                pass
+    finally:
+        connector.remove_listener(watch_position)
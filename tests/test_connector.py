@@ -0,0 +1,230 @@
+import asyncio
+from binascii import unhexlify
+from typing import Callable, List, Optional
+
+from somfy.connector import ConnectionFactory, SomfyConnector, SocketConnectionFactory, BackoffPolicy, \
+    try_to_exchange_one, detect_devices
+from somfy.messages import SomfyMessage, SomfyMessageId, SomfyAddress, NodeType, MASTER_ADDRESS
+
+MOTOR_ADDR = SomfyAddress.make("133DC6")
+
+# GET_MOTOR_LIMITS/POST_MOTOR_LIMITS and GET_MOTOR_POSITION/POST_MOTOR_POSITION exchanges
+captured_traffic = unhexlify("def4ff80808039c2ec0638"
+                             "cef07f39c2ec808080ffff28c5088f"
+                             "f3f4ff80808039c2ec064d"
+                             "f2ef7f39c2ec8080809cf6ef00000848")
+post_motor_position = unhexlify("f2ef7f39c2ec8080809cf6ef00000848")
+post_node_addr = unhexlify("9ff47f39c2ec8080800579")
+
+
+# The written data is delivered right away, so nothing is ever buffered
+class _FakeTransport(object):
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+
+# Emulates the SDN bus: the written messages are passed to `responder`, and the bytes it returns are fed
+# back into the reader.
+class _FakeWriter(object):
+    def __init__(self, reader: asyncio.StreamReader, responder: Callable[[bytes], bytes]):
+        self.reader = reader
+        self.responder = responder
+        self.transport = _FakeTransport()
+        self.written = list[bytes]()
+        self.closed = False
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        reply = self.responder(bytes(data))
+        if reply:
+            self.reader.feed_data(reply)
+
+    def writelines(self, frames):
+        for data in frames:
+            self.write(data)
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        # Closing the transport terminates the pending reads
+        self.closed = True
+        self.reader.feed_eof()
+
+
+class _FakeConnectionFactory(ConnectionFactory):
+    def __init__(self, initial_data: bytes = b'', responder: Callable[[bytes], bytes] = lambda d: b''):
+        self.initial_data = initial_data
+        self.responder = responder
+        self.writer: Optional[_FakeWriter] = None
+
+    async def connect(self) -> (asyncio.StreamReader, _FakeWriter):
+        reader = asyncio.StreamReader()
+        reader.feed_data(self.initial_data)
+        self.writer = _FakeWriter(reader, self.responder)
+        return reader, self.writer
+
+
+# Check that the drainer passes the bus traffic to the sniffer callback
+def test_sniffer() -> None:
+    async def run() -> List[SomfyMessage]:
+        sniffed = list[SomfyMessage]()
+        async with SomfyConnector(_FakeConnectionFactory(captured_traffic), sniffer_callback=sniffed.append):
+            for _ in range(100):
+                if len(sniffed) == 4:
+                    break
+                await asyncio.sleep(0.01)
+        return sniffed
+
+    messages = asyncio.run(run())
+    assert [m.msgid for m in messages] == [SomfyMessageId.GET_MOTOR_LIMITS, SomfyMessageId.POST_MOTOR_LIMITS,
+                                           SomfyMessageId.GET_MOTOR_POSITION, SomfyMessageId.POST_MOTOR_POSITION]
+
+
+# The listeners get the bus traffic outside the exchanges, even without the sniffer callback
+def test_listener() -> None:
+    async def run() -> List[SomfyMessage]:
+        heard = list[SomfyMessage]()
+        async with SomfyConnector(_FakeConnectionFactory()) as conn:
+            conn.add_listener(heard.append)
+            conn.channel.reader.feed_data(captured_traffic)
+            for _ in range(100):
+                if len(heard) == 4:
+                    break
+                await asyncio.sleep(0.01)
+            conn.remove_listener(heard.append)
+        return heard
+
+    messages = asyncio.run(run())
+    assert [m.msgid for m in messages] == [SomfyMessageId.GET_MOTOR_LIMITS, SomfyMessageId.POST_MOTOR_LIMITS,
+                                           SomfyMessageId.GET_MOTOR_POSITION, SomfyMessageId.POST_MOTOR_POSITION]
+
+
+# Check the exchange over a real TCP connection
+def test_socket_exchange() -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read(1)
+        writer.write(captured_traffic)
+        await writer.drain()
+        await reader.read()
+        writer.close()
+
+    async def run() -> Optional[SomfyMessage]:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            async with SomfyConnector(SocketConnectionFactory("127.0.0.1", port)) as conn:
+                return await try_to_exchange_one(conn, MOTOR_ADDR, SomfyMessageId.GET_MOTOR_POSITION,
+                                                 SomfyMessageId.POST_MOTOR_POSITION)
+
+    reply = asyncio.run(run())
+    assert reply is not None
+    assert reply.payload.as_dict()["position_pulses"] == 2403
+
+
+# Check the request/reply exchange, with some noise on the bus before the reply
+def test_exchange() -> None:
+    factory = _FakeConnectionFactory(responder=lambda d: b'\x12\x34' + post_motor_position)
+
+    async def run() -> Optional[SomfyMessage]:
+        async with SomfyConnector(factory) as conn:
+            return await try_to_exchange_one(conn, MOTOR_ADDR, SomfyMessageId.GET_MOTOR_POSITION,
+                                             SomfyMessageId.POST_MOTOR_POSITION)
+
+    reply = asyncio.run(run())
+    assert reply is not None
+    assert reply.msgid == SomfyMessageId.POST_MOTOR_POSITION
+    assert reply.from_addr == MOTOR_ADDR
+    assert reply.payload.as_dict()["position_pulses"] == 2403
+
+    sent = SomfyMessage(msgid=SomfyMessageId.GET_MOTOR_POSITION, from_node_type=NodeType.TYPE_ALL,
+                        from_addr=MASTER_ADDRESS, to_node_type=NodeType.TYPE_ALL, to_addr=MOTOR_ADDR)
+    assert factory.writer.written == [sent.serialize()]
+
+
+# The detection waits for the full timeout, gathering all the replies
+def test_detect() -> None:
+    async def run():
+        async with SomfyConnector(_FakeConnectionFactory(responder=lambda d: post_node_addr)) as conn:
+            conn.timeout = 0.1
+            return await detect_devices(conn)
+
+    assert asyncio.run(run()) == [(MOTOR_ADDR, NodeType.TYPE_50DC_SERIES)]
+
+
+# The data received after the reply is left for the drainer
+def test_exchange_leftover() -> None:
+    async def run() -> List[SomfyMessage]:
+        sniffed = list[SomfyMessage]()
+        factory = _FakeConnectionFactory(responder=lambda d: post_motor_position + post_node_addr)
+        async with SomfyConnector(factory, sniffer_callback=sniffed.append) as conn:
+            reply = await try_to_exchange_one(conn, MOTOR_ADDR, SomfyMessageId.GET_MOTOR_POSITION,
+                                              SomfyMessageId.POST_MOTOR_POSITION)
+            assert reply is not None
+            for _ in range(100):
+                if sniffed:
+                    break
+                await asyncio.sleep(0.01)
+        return sniffed
+
+    assert [m.msgid for m in asyncio.run(run())] == [SomfyMessageId.POST_NODE_ADDR]
+
+
+# The concurrent exchanges take turns on the channel
+def test_concurrent_exchanges() -> None:
+    factory = _FakeConnectionFactory(responder=lambda d: post_motor_position)
+
+    async def run():
+        async with SomfyConnector(factory) as conn:
+            return await asyncio.gather(*[try_to_exchange_one(conn, MOTOR_ADDR, SomfyMessageId.GET_MOTOR_POSITION,
+                                                              SomfyMessageId.POST_MOTOR_POSITION)
+                                          for _ in range(3)])
+
+    replies = asyncio.run(run())
+    assert [r.msgid for r in replies] == [SomfyMessageId.POST_MOTOR_POSITION] * 3
+    assert len(factory.writer.written) == 3
+
+
+# Several messages can be sent at once, the replies to all of them are received by the consumer
+def test_exchange_many() -> None:
+    factory = _FakeConnectionFactory(responder=lambda d: post_motor_position)
+    to_send = [SomfyMessage(msgid=SomfyMessageId.GET_MOTOR_POSITION, from_node_type=NodeType.TYPE_ALL,
+                            from_addr=MASTER_ADDRESS, to_node_type=NodeType.TYPE_ALL, to_addr=MOTOR_ADDR)
+               for _ in range(3)]
+
+    async def run() -> List[SomfyMessage]:
+        replies = list[SomfyMessage]()
+
+        def consume(msg: SomfyMessage) -> bool:
+            replies.append(msg)
+            return len(replies) < len(to_send)
+
+        async with SomfyConnector(factory) as conn:
+            await conn.exchange_many(to_send, consume)
+        return replies
+
+    assert [r.msgid for r in asyncio.run(run())] == [SomfyMessageId.POST_MOTOR_POSITION] * 3
+    assert factory.writer.written == [msg.serialize() for msg in to_send]
+
+
+# The wait time doubles after each failure, up to the limit
+def test_backoff_policy() -> None:
+    policy = BackoffPolicy()
+    waits = [policy.get_wait_time_sec_after_a_failure() for _ in range(12)]
+    assert waits == [0, 1, 2, 4, 8, 16, 32, 64, 100, 100, 100, 100]
+    policy.success()
+    assert policy.get_wait_time_sec_after_a_failure() == 0
+
+
+# The expected reply can be given as a plain int
+def test_exchange_int_reply() -> None:
+    factory = _FakeConnectionFactory(responder=lambda d: post_motor_position)
+
+    async def run() -> Optional[SomfyMessage]:
+        async with SomfyConnector(factory) as conn:
+            return await try_to_exchange_one(conn, MOTOR_ADDR, SomfyMessageId.GET_MOTOR_POSITION,
+                                             int(SomfyMessageId.POST_MOTOR_POSITION))
+
+    reply = asyncio.run(run())
+    assert reply is not None
+    assert reply.msgid == SomfyMessageId.POST_MOTOR_POSITION
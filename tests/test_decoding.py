@@ -1,6 +1,8 @@
 import random
 from binascii import unhexlify
 
+import pytest
+
 from somfy.recognizer import MessageRecognizer
 from somfy.messages import SomfyMessage
 
@@ -77,11 +79,11 @@ ID: 60(POST_NODE_ADDR) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F
 ID: 60(POST_NODE_ADDR) FROM: 08(TYPE_50DC_SERIES) 133D94 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 2403, 'position_percent': 16, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 2403, 'position_percent': 16, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 25(GET_MOTOR_IP) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {'ip_index': 1}
@@ -120,54 +122,74 @@ ID: 23(GET_MOTOR_ROLLING_SPEED) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC
 ID: 33(POST_MOTOR_ROLLING_SPEED) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'up_speed_rpm': 25, 'down_speed_rpm': 25, 'slow_speed_rpm': 15}
 ID: 04(CTRL_MOVE_RELATIVE) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {'function': <RelativeMoveFunction.MOVE_NEXT_IP_DOWN: 0>, 'parameter': 0}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 3386, 'position_percent': 22, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 4432, 'position_percent': 29, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 5533, 'position_percent': 37, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 6613, 'position_percent': 44, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}
 ID: 21(GET_MOTOR_LIMITS) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
-ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'reserved': 0, 'limit': 15063}
+ID: 31(POST_MOTOR_LIMITS) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'limit': 15063}
 ID: 0C(GET_MOTOR_POSITION) FROM: 00(TYPE_ALL) 7F7F7F TO: 00(TYPE_ALL) 133DC6 ACK: False DATA: {}
 ID: 0D(POST_MOTOR_POSITION) FROM: 08(TYPE_50DC_SERIES) 133DC6 TO: 00(TYPE_ALL) 7F7F7F ACK: False DATA: {'position_pulses': 12319, 'position_percent': 82, 'tilt_percent': 255, 'ip': None, 'tilt_degrees': None}"""
 
+# The captured session as a single buffer, and message by message
+decoded_bytes = unhexlify(message_stream.replace("\n", ""))
+message_bytes = [unhexlify(msg) for msg in message_stream.splitlines(keepends=False)]
+expected_messages = decoded_stream.split("\n")
+
+
+# A random-length gap of noise between the messages
+def _noise(rand: random.Random) -> bytes:
+    return rand.randbytes(rand.randrange(0, 100))
+
 
 # Check that we can decode a simple captures session
 def test_decoding() -> None:
     mr = MessageRecognizer()
     messages = list[SomfyMessage]()
-    decoded_bytes = unhexlify(message_stream.replace("\n", "").replace("\r", ""))
-    msg_bytes = []
-    for bt in decoded_bytes:
-        cur_msg = mr.add_data(bt)
-        msg_bytes.append(bt)
-        if cur_msg is not None:
-            messages.append(cur_msg)
-            # Check round-tripping (the serialized message must be equal to the source bytes)
-            r1 = cur_msg.serialize()
-            assert r1 == bytes(msg_bytes)
-            m2 = SomfyMessage.try_parse(r1)
-            assert m2.as_dict() == cur_msg.as_dict()
-            msg_bytes = []
-
-    expected_messages = decoded_stream.split("\n")
-    assert len(expected_messages) == len(messages)
-    for i in range(0, len(messages)):
-        assert messages[i].__str__() == expected_messages[i]
+    # The messages are back-to-back, so each one starts where the previous one ends
+    start = 0
+    for cur_msg, end in mr.add_bytes(decoded_bytes):
+        messages.append(cur_msg)
+        # Check round-tripping (the serialized message must be equal to the source bytes)
+        r1 = cur_msg.serialize()
+        assert r1 == decoded_bytes[start:end]
+        m2 = SomfyMessage.try_parse(r1)
+        assert m2.as_dict() == cur_msg.as_dict()
+        start = end
+
+    assert list(map(str, messages)) == expected_messages
+
+
+# Check each captured message on its own, so that a failure points at the exact message
+@pytest.mark.parametrize("raw,expected", list(zip(message_bytes, expected_messages)))
+def test_decoding_message(raw: bytes, expected: str) -> None:
+    msg = SomfyMessage.try_parse(raw)
+    assert msg is not None
+    assert str(msg) == expected
+    assert msg.serialize() == raw
+
+
+# The public checksum helper returns the [high, low] checksum bytes
+def test_compute_checksum() -> None:
+    raw = message_bytes[0]
+    assert SomfyMessage.compute_checksum(raw[:-2]) == [raw[-2], raw[-1]]
 
 
 # Test that the recognizer can deal with the noisy input
 def test_recognizer() -> None:
     mr = MessageRecognizer()
+    add_data = mr.add_data
     messages = list[SomfyMessage]()
 
     # Deterministic seeded generator:
@@ -175,20 +197,39 @@ def test_recognizer() -> None:
     # We don't use crypto-safe randoms for a slim chance that the generated bytes
     # just happen to form a real message.
 
-    for msg in message_stream.splitlines(keepends=False):
+    for msg in message_bytes:
         # Add some noise!
-        for i in range(0, rand.randrange(0, 100)):
-            mr.add_data(rand.randbytes(1)[0])
+        for bt in _noise(rand):
+            add_data(bt)
         # The rest of the message
-        for bt in unhexlify(msg):
-            cur_msg = mr.add_data(bt)
+        for bt in msg:
+            cur_msg = add_data(bt)
             if cur_msg is not None:
                 messages.append(cur_msg)
         # More noise!
-        for i in range(0, rand.randrange(0, 100)):
-            mr.add_data(rand.randbytes(1)[0])
+        for bt in _noise(rand):
+            add_data(bt)
 
-    expected_messages = decoded_stream.split("\n")
+    # The noise might happen to form extra messages after the real ones
     assert len(expected_messages) <= len(messages)
-    for i in range(0, len(messages)):
-        assert messages[i].__str__() == expected_messages[i]
+    assert list(map(str, messages[:len(expected_messages)])) == expected_messages
+
+
+# The bulk recognition must find the same messages as the byte-by-byte one, regardless of the chunking
+def test_recognizer_bulk() -> None:
+    rand = random.Random(x=4)
+    noisy = b''.join(_noise(rand) + msg for msg in message_bytes)
+
+    add_data = MessageRecognizer().add_data
+    expected = [(str(msg), i + 1) for i, bt in enumerate(noisy) if (msg := add_data(bt)) is not None]
+
+    bulk_mr = MessageRecognizer()
+    messages = []
+    pos = 0
+    while pos < len(noisy):
+        chunk = noisy[pos:pos + rand.randrange(1, 64)]
+        messages.extend((str(msg), pos + end) for msg, end in bulk_mr.add_bytes(chunk))
+        pos += len(chunk)
+
+    assert messages == expected
+    assert len(messages) >= len(expected_messages)
@@ -0,0 +1,61 @@
+import pytest
+
+from somfy.messages import SomfyPayload
+from somfy.payloads import GroupAddrPayload, SetMotorIPPayload, SomfyMotorIPFunction, CtrlMoveToPayload, \
+    CtrlMoveToFunction, PostMotorPositionPayload, PostMotorIPPayload, NodeLabelPayload, \
+    PostMotorStatusPayload, MotorStatus, MotorDirection, MotorCommandSource, \
+    CtrlMoveRelativePayload, RelativeMoveFunction
+
+
+# The group ID is a 24-bit big-endian value
+def test_group_addr() -> None:
+    payload = GroupAddrPayload.make(group_index=2, group_id=0x123456)
+    assert list(payload.serialize()) == [0x02, 0x12, 0x34, 0x56]
+    assert payload.as_dict() == {"group_index": 2, "group_id": 0x123456}
+    assert GroupAddrPayload([0x01, 0xFF, 0x00, 0x01]).get_group_id() == 0xFF0001
+
+
+# A zero angle is a valid value, it must not be dropped
+def test_zero_angle() -> None:
+    assert SetMotorIPPayload.make(SomfyMotorIPFunction.SET_AT_SPECIFIED_POSITION_AND_ANGLE_IN_DEGREES,
+                                  1, 100, 0).as_dict()["angle"] == 0
+    assert CtrlMoveToPayload.make(CtrlMoveToFunction.POSITION_PERCENT_ANGLE_DEGREES, 50, 0).as_dict()["angle"] == 0
+    assert PostMotorPositionPayload.make(2403, 16, 0, 0xFF, 0).as_dict()["tilt_degrees"] == 0
+
+    payload = PostMotorIPPayload.make(ip_index=1, position=50, angle=0)
+    assert payload.as_dict() == {"ip_index": 1, "position": 50, "angle": 0}
+    assert PostMotorIPPayload.make(ip_index=1, position=50, angle=None).as_dict()["angle"] is None
+
+
+# The labels are padded on the bus, the padding is not a part of the label
+def test_node_label() -> None:
+    assert NodeLabelPayload.make("Kitchen").as_dict() == {"label": "Kitchen"}
+    assert NodeLabelPayload(b'Kitchen \x00\x00\x00\x00\x00\x00\x00\x00').get_label() == "Kitchen"
+
+
+# The status fields are decoded once, the unknown values are kept as ints
+def test_motor_status() -> None:
+    payload = PostMotorStatusPayload(b'\x01\x00\x02\x7F')
+    assert payload.get_status() is MotorStatus.RUNNING
+    assert payload.as_dict() == {"status": MotorStatus.RUNNING, "direction": MotorDirection.DOWN,
+                                 "command_source": MotorCommandSource.LOCAL_UI, "status_cause": 0x7F}
+
+
+# The relative move parameter is a 16-bit LSB-first value
+def test_move_relative_parameter() -> None:
+    payload = CtrlMoveRelativePayload.make(RelativeMoveFunction.MOVE_NUM_PULSES_UP, 0x1234)
+    assert payload.serialize() == b'\x03\x34\x12\x00'
+    assert payload.get_parameter() == 0x1234
+    assert payload.as_dict() == {"function": RelativeMoveFunction.MOVE_NUM_PULSES_UP, "parameter": 0x1234}
+
+
+# The content must be a sequence of byte values of a valid length
+def test_invalid_content() -> None:
+    with pytest.raises(ValueError):
+        SomfyPayload(5)
+    with pytest.raises(ValueError):
+        SomfyPayload([1, 256])
+    with pytest.raises(ValueError):
+        SomfyPayload(None)
+    with pytest.raises(ValueError):
+        GroupAddrPayload(b'\x01\x02')